@@ -24,6 +24,14 @@ def main():
     parser.add_argument("--coverage", action="store_true", help="Run tests with coverage report")
     parser.add_argument("--fast", action="store_true", help="Run tests without coverage for faster execution")
     parser.add_argument("--verbose", "-v", action="store_true", help="Verbose output")
+    parser.add_argument(
+        "--parallel",
+        "-n",
+        nargs="?",
+        const="auto",
+        metavar="NUM",
+        help="Distribute tests across NUM workers, or one per CPU core if omitted (requires pytest-xdist)",
+    )
 
     args = parser.parse_args()
 
@@ -47,6 +55,10 @@ def main():
     if args.verbose:
         cmd.append("-v")
 
+    # Parallel mode - NUM workers (default one per core), each test module kept on a single worker
+    if args.parallel:
+        cmd.extend(["-n", args.parallel, "--dist=loadfile"])
+
     # Fast mode - minimal output
     if args.fast:
         cmd.extend(["--tb=line", "-q"])
@@ -3,6 +3,7 @@ Pytest configuration and shared fixtures for Ophelos SDK tests.
 """
 
 from datetime import date, datetime
+from types import MappingProxyType
 from unittest.mock import Mock, patch
 
 import pytest
@@ -12,6 +13,12 @@ from ophelos_sdk.auth import OAuth2Authenticator
 from ophelos_sdk.http_client import HTTPClient
 
 
+def pytest_configure(config):
+    """Register custom markers; pytest does not read the [tool:pytest] section in pytest.ini."""
+    config.addinivalue_line("markers", "integration: marks tests as integration tests")
+    config.addinivalue_line("markers", "slow: marks tests as slow (deselect with '-m \"not slow\"')")
+
+
 @pytest.fixture
 def mock_auth_response():
     """Mock OAuth2 token response."""
@@ -34,57 +41,65 @@ def mock_http_client():
     return client
 
 
-@pytest.fixture
-def sample_debt_data():
-    """Sample debt data for testing."""
+@pytest.fixture(scope="session")
+def _sample_debt_data():
+    """Read-only sample debt data, built once per session."""
     created_at = datetime.now().isoformat()
     updated_at = datetime.now().isoformat()
-    return {
-        "id": "debt_123456789",
-        "object": "debt",
-        "account_number": "ACC-001",
-        "currency": "GBP",
-        "status": {
-            "value": "prepared",
-            "whodunnit": "system",
-            "context": None,
-            "reason": None,
-            "updated_at": updated_at,
-        },
-        "kind": "purchased",
-        "start_at": date.today().isoformat(),
-        "customer": "cust_123456789",
-        "organisation": "org_123456789",
-        "summary": {
-            "amount_total": 10000,
-            "amount_paid": 0,
-            "amount_remaining": 10000,
-            "breakdown": {
-                "principal": 10000,
-                "interest": 0,
-                "fees": 0,
-                "discounts": 0,
-                "charges": 0,
-                "value_added_tax": 0,
-                "miscellaneous": 0,
-                "refunds": 0,
+    return MappingProxyType(
+        {
+            "id": "debt_123456789",
+            "object": "debt",
+            "account_number": "ACC-001",
+            "currency": "GBP",
+            "status": {
+                "value": "prepared",
+                "whodunnit": "system",
+                "context": None,
+                "reason": None,
+                "updated_at": updated_at,
+            },
+            "kind": "purchased",
+            "start_at": date.today().isoformat(),
+            "customer": "cust_123456789",
+            "organisation": "org_123456789",
+            "summary": {
+                "amount_total": 10000,
+                "amount_paid": 0,
+                "amount_remaining": 10000,
+                "breakdown": {
+                    "principal": 10000,
+                    "interest": 0,
+                    "fees": 0,
+                    "discounts": 0,
+                    "charges": 0,
+                    "value_added_tax": 0,
+                    "miscellaneous": 0,
+                    "refunds": 0,
+                },
+                "history": [],
+                "created_at": created_at,
+                "updated_at": updated_at,
             },
-            "history": [],
+            "invoices": [],
+            "line_items": [],
+            "payments": [],
+            "payment_plans": [],
+            "tags": [],
+            "configurations": {},
+            "calculated_configurations": {},
+            "originator": None,
+            "metadata": {"case_id": "12345", "original_creditor": "Test Corp"},
             "created_at": created_at,
             "updated_at": updated_at,
-        },
-        "invoices": [],
-        "line_items": [],
-        "payments": [],
-        "payment_plans": [],
-        "tags": [],
-        "configurations": {},
-        "calculated_configurations": {},
-        "originator": None,
-        "metadata": {"case_id": "12345", "original_creditor": "Test Corp"},
-        "created_at": created_at,
-        "updated_at": updated_at,
-    }
+        }
+    )
+
+
+@pytest.fixture
+def sample_debt_data(_sample_debt_data):
+    """Sample debt data for testing, copied per test because resource parsing injects _req_res."""
+    return dict(_sample_debt_data)
 
 
 @pytest.fixture
@@ -109,23 +124,32 @@ def sample_customer_data():
     }
 
 
+@pytest.fixture(scope="session")
+def _sample_payment_data():
+    """Read-only sample payment data, built once per session."""
+    timestamp = datetime.now().isoformat()
+    return MappingProxyType(
+        {
+            "id": "pay_123456789",
+            "object": "payment",
+            "amount": 5000,
+            "currency": "GBP",
+            "status": "succeeded",
+            "payment_provider": "stripe",
+            "transaction_ref": "txn_12345",
+            "transaction_at": timestamp,
+            "debt": "debt_123456789",
+            "metadata": {"external_ref": "EXT-123"},
+            "created_at": timestamp,
+            "updated_at": timestamp,
+        }
+    )
+
+
 @pytest.fixture
-def sample_payment_data():
-    """Sample payment data for testing."""
-    return {
-        "id": "pay_123456789",
-        "object": "payment",
-        "amount": 5000,
-        "currency": "GBP",
-        "status": "succeeded",
-        "payment_provider": "stripe",
-        "transaction_ref": "txn_12345",
-        "transaction_at": datetime.now().isoformat(),
-        "debt": "debt_123456789",
-        "metadata": {"external_ref": "EXT-123"},
-        "created_at": datetime.now().isoformat(),
-        "updated_at": datetime.now().isoformat(),
-    }
+def sample_payment_data(_sample_payment_data):
+    """Sample payment data for testing, copied per test because resource parsing injects _req_res."""
+    return dict(_sample_payment_data)
 
 
 @pytest.fixture
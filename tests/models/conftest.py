@@ -0,0 +1,55 @@
+"""
+Shared fixtures for model tests.
+"""
+
+from datetime import datetime
+
+import pytest
+
+from ophelos_sdk.models import DebtSummary, StatusObject, SummaryBreakdown
+
+
+@pytest.fixture(scope="session")
+def now():
+    """Frozen timestamp shared by model tests."""
+    return datetime(2024, 1, 1, 12, 0, 0)
+
+
+@pytest.fixture(scope="session")
+def sample_breakdown():
+    """Summary breakdown with every component populated."""
+    return SummaryBreakdown(
+        principal=10000,
+        interest=500,
+        fees=100,
+        discounts=-200,
+        charges=50,
+        value_added_tax=210,
+        miscellaneous=25,
+        refunds=-100,
+    )
+
+
+@pytest.fixture(scope="session")
+def sample_summary(sample_breakdown, now):
+    """Debt summary with a partial payment and a breakdown."""
+    return DebtSummary(
+        amount_total=10600,
+        amount_paid=2000,
+        amount_remaining=8600,
+        breakdown=sample_breakdown,
+        created_at=now,
+        updated_at=now,
+    )
+
+
+@pytest.fixture(scope="session")
+def prepared_status(now):
+    """Prebuilt status for a debt in the prepared state, so debts built with it skip nested validation."""
+    return StatusObject.model_construct(value="prepared", whodunnit="system", updated_at=now)
+
+
+@pytest.fixture(scope="session")
+def server_fields():
+    """Server-managed fields that never appear in a request body."""
+    return frozenset({"id", "object", "created_at", "updated_at"})
@@ -0,0 +1,85 @@
+"""
+Benchmarks for to_api_body() serialization.
+
+Run with: python -m pytest tests/models/test_api_body_perf.py --benchmark-only
+"""
+
+from datetime import date
+
+import pytest
+
+from ophelos_sdk.models import Currency, Payout, Tenant, Webhook
+
+pytest.importorskip("pytest_benchmark")
+
+_EVENTS = [
+    "customer.created",
+    "customer.updated",
+    "debt.created",
+    "debt.updated",
+    "debt.status_changed",
+    "payment.created",
+    "payment.completed",
+    "payment.failed",
+    "invoice.created",
+    "invoice.sent",
+]
+
+
+class TestApiBodyBenchmarks:
+    """Benchmarks for the largest payout, tenant and webhook request bodies."""
+
+    def test_bench_payout_to_api_body(self, benchmark, now):
+        """Benchmark payout to_api_body with enum, date and metadata fields."""
+        payout = Payout(
+            id="payout_bench",
+            amount=60000,
+            currency=Currency.GBP,
+            status="processing",
+            payout_date=date(2024, 6, 1),
+            organisation_id="org_bench",
+            created_at=now,
+            updated_at=now,
+            metadata={"priority": "high", "batch": {"id": "batch_001", "size": 250}},
+        )
+
+        api_body = benchmark(payout.to_api_body)
+
+        assert api_body["payout_date"] == "2024-06-01"
+
+    def test_bench_tenant_to_api_body(self, benchmark, now):
+        """Benchmark tenant to_api_body with nested configurations."""
+        tenant = Tenant.model_construct(
+            id="tenant_bench",
+            name="Benchmark Tenant",
+            description="Tenant used for serialization benchmarks",
+            configurations={
+                "rate_limits": {"requests_per_minute": 1000, "burst_limit": 50},
+                "features": {"advanced_reporting": True, "multi_currency": True},
+            },
+            metadata={"environment": "test"},
+            created_at=now,
+            updated_at=now,
+        )
+
+        api_body = benchmark(tenant.to_api_body)
+
+        assert api_body["name"] == "Benchmark Tenant"
+
+    def test_bench_webhook_to_api_body(self, benchmark, now):
+        """Benchmark webhook to_api_body with a full event list."""
+        webhook = Webhook.model_construct(
+            id="webhook_bench",
+            url="https://example.com/webhook",
+            enabled=True,
+            enabled_events=_EVENTS,
+            signing_key="whsec_bench_secret",
+            version="v1",
+            metadata={"team": "backend"},
+            created_at=now,
+            updated_at=now,
+        )
+
+        api_body = benchmark(webhook.to_api_body)
+
+        assert api_body["enabled_events"] == _EVENTS
@@ -0,0 +1,98 @@
+"""
+Unit tests for DebtStatus enum.
+"""
+
+import pytest
+
+from ophelos_sdk.models import DebtStatus
+
+_EXPECTED_STATUSES = frozenset(
+    {
+        # Client flow
+        "initializing",
+        "prepared",
+        "paused",
+        "withdrawn",
+        "deleted",
+        # Ophelos Flow
+        "analysing",
+        "resumed",
+        "contacted",
+        "contact_established",
+        "contact_failed",
+        "enriching",
+        "returned",
+        "discharged",
+        # Customer Flow
+        "arranging",
+        "paying",
+        "settled",
+        "paid",
+        # Action Required
+        "queried",
+        "disputed",
+        "defaulted",
+        "follow_up_required",
+        "adjusted",
+        # Customer Operations
+        "assessing",
+        "recovering",
+        "process_exhausted",
+        # Legal flow
+        "legal_protection",
+        # Legacy
+        "closed",
+        "open",
+    }
+)
+
+_STATUS_CASES = [
+    # Client flow
+    (DebtStatus.INITIALIZING, "initializing"),
+    (DebtStatus.PREPARED, "prepared"),
+    (DebtStatus.PAUSED, "paused"),
+    (DebtStatus.WITHDRAWN, "withdrawn"),
+    (DebtStatus.DELETED, "deleted"),
+    # Ophelos Flow
+    (DebtStatus.ANALYSING, "analysing"),
+    (DebtStatus.RESUMED, "resumed"),
+    (DebtStatus.CONTACTED, "contacted"),
+    (DebtStatus.CONTACT_ESTABLISHED, "contact_established"),
+    (DebtStatus.CONTACT_FAILED, "contact_failed"),
+    (DebtStatus.ENRICHING, "enriching"),
+    (DebtStatus.RETURNED, "returned"),
+    (DebtStatus.DISCHARGED, "discharged"),
+    # Customer Flow
+    (DebtStatus.ARRANGING, "arranging"),
+    (DebtStatus.PAYING, "paying"),
+    (DebtStatus.SETTLED, "settled"),
+    (DebtStatus.PAID, "paid"),
+    # Action Required
+    (DebtStatus.QUERIED, "queried"),
+    (DebtStatus.DISPUTED, "disputed"),
+    (DebtStatus.DEFAULTED, "defaulted"),
+    (DebtStatus.FOLLOW_UP_REQUIRED, "follow_up_required"),
+    (DebtStatus.ADJUSTED, "adjusted"),
+    # Customer Operations
+    (DebtStatus.ASSESSING, "assessing"),
+    (DebtStatus.RECOVERING, "recovering"),
+    (DebtStatus.PROCESS_EXHAUSTED, "process_exhausted"),
+    # Legal flow
+    (DebtStatus.LEGAL_PROTECTION, "legal_protection"),
+    # Legacy
+    (DebtStatus.CLOSED, "closed"),
+    (DebtStatus.OPEN, "open"),
+]
+
+
+class TestDebtStatusEnum:
+    """Test cases for DebtStatus enum."""
+
+    def test_debt_status_enum_completeness(self):
+        """Test that all debt status enum values are defined."""
+        assert {member.value for member in DebtStatus} == _EXPECTED_STATUSES
+
+    @pytest.mark.parametrize("member,value", _STATUS_CASES)
+    def test_debt_status_value(self, member, value):
+        """Test each debt status enum member maps to its API value."""
+        assert member == value
@@ -2,22 +2,27 @@
 Unit tests for enumeration types.
 """
 
+import pytest
+
 from ophelos_sdk.models import ContactDetailType, Currency
 
 
 class TestEnumerations:
     """Test cases for enumeration types."""
 
-    def test_currency_enum(self):
-        """Test currency enumeration."""
-        assert Currency.GBP == "GBP"
-        assert Currency.EUR == "EUR"
-        assert Currency.USD == "USD"
-
-    def test_contact_detail_type_enum(self):
-        """Test contact detail type enumeration."""
-        assert ContactDetailType.EMAIL == "email"
-        assert ContactDetailType.PHONE_NUMBER == "phone_number"
-        assert ContactDetailType.MOBILE_NUMBER == "mobile_number"
-        assert ContactDetailType.FAX_NUMBER == "fax_number"
-        assert ContactDetailType.ADDRESS == "address"
+    @pytest.mark.parametrize(
+        "member,value",
+        [
+            (Currency.GBP, "GBP"),
+            (Currency.EUR, "EUR"),
+            (Currency.USD, "USD"),
+            (ContactDetailType.EMAIL, "email"),
+            (ContactDetailType.PHONE_NUMBER, "phone_number"),
+            (ContactDetailType.MOBILE_NUMBER, "mobile_number"),
+            (ContactDetailType.FAX_NUMBER, "fax_number"),
+            (ContactDetailType.ADDRESS, "address"),
+        ],
+    )
+    def test_enum_value(self, member, value):
+        """Test each currency and contact detail type member maps to its API value."""
+        assert member == value
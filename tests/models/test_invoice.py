@@ -4,46 +4,79 @@ Unit tests for Invoice model.
 
 from datetime import date, datetime
 
+import pytest
+
 from ophelos_sdk.models import Currency, Debt, Invoice, LineItem, LineItemKind
 
+_EXPECTED_KINDS = frozenset({"debt", "interest", "fee", "vat", "credit", "discount", "refund", "creditor_refund"})
+
+_KIND_CASES = [
+    (LineItemKind.DEBT, "debt"),
+    (LineItemKind.INTEREST, "interest"),
+    (LineItemKind.FEE, "fee"),
+    (LineItemKind.VAT, "vat"),
+    (LineItemKind.CREDIT, "credit"),
+    (LineItemKind.DISCOUNT, "discount"),
+    (LineItemKind.REFUND, "refund"),
+    (LineItemKind.CREDITOR_REFUND, "creditor_refund"),
+]
+
+
+@pytest.fixture(scope="module")
+def invoice_api_body(now):
+    """API body of a fully populated invoice, serialized once per module."""
+    invoice = Invoice.model_construct(
+        id="inv_123",
+        object="invoice",
+        debt="debt_456",
+        currency="GBP",
+        reference="INV-2024-001",
+        status="outstanding",
+        invoiced_on=date(2024, 1, 15),
+        due_on=date(2024, 2, 15),
+        description="Test invoice",
+        created_at=now,
+        updated_at=now,
+        metadata={"invoice_type": "standard"},
+    )
+    return invoice.to_api_body()
+
+
+@pytest.fixture(scope="module")
+def expandable_invoice_data(now, prepared_status):
+    """Invoice payload with an expanded debt, built once per module; tests must not mutate it."""
+    return {
+        "id": "inv_123",
+        "object": "invoice",
+        "debt": {
+            "id": "debt_456",
+            "object": "debt",
+            "status": prepared_status,
+            "customer": "cust_789",
+            "organisation": "org_101",
+            "summary": {"amount_total": 5000, "amount_paid": 0, "amount_remaining": 5000},
+            "created_at": now,
+            "updated_at": now,
+        },
+        "currency": "GBP",
+        "reference": "INV-2024-001",
+        "status": "outstanding",
+        "invoiced_on": date(2024, 1, 15),
+        "due_on": date(2024, 2, 15),
+        "description": "Test invoice",
+        "line_items": ["li_123", "li_456"],
+        "created_at": now,
+        "updated_at": now,
+        "metadata": {"invoice_type": "standard"},
+    }
+
 
 class TestUpdatedInvoiceModel:
     """Test cases for updated Invoice model."""
 
-    def test_invoice_with_expandable_debt(self):
+    def test_invoice_with_expandable_debt(self, expandable_invoice_data):
         """Test invoice with expandable debt field."""
-        invoice_data = {
-            "id": "inv_123",
-            "object": "invoice",
-            "debt": {
-                "id": "debt_456",
-                "object": "debt",
-                "status": {
-                    "value": "prepared",
-                    "whodunnit": "system",
-                    "context": None,
-                    "reason": None,
-                    "updated_at": datetime.now().isoformat(),
-                },
-                "customer": "cust_789",
-                "organisation": "org_101",
-                "summary": {"amount_total": 5000, "amount_paid": 0, "amount_remaining": 5000},
-                "created_at": datetime.now().isoformat(),
-                "updated_at": datetime.now().isoformat(),
-            },
-            "currency": "GBP",
-            "reference": "INV-2024-001",
-            "status": "outstanding",
-            "invoiced_on": "2024-01-15",
-            "due_on": "2024-02-15",
-            "description": "Test invoice",
-            "line_items": ["li_123", "li_456"],
-            "created_at": datetime.now().isoformat(),
-            "updated_at": datetime.now().isoformat(),
-            "metadata": {"invoice_type": "standard"},
-        }
-
-        invoice = Invoice(**invoice_data)
+        invoice = Invoice(**expandable_invoice_data)
 
         assert invoice.id == "inv_123"
         assert invoice.object == "invoice"
@@ -58,7 +91,7 @@ class TestUpdatedInvoiceModel:
         assert invoice.line_items == ["li_123", "li_456"]
         assert invoice.metadata == {"invoice_type": "standard"}
 
-    def test_invoice_with_debt_id(self):
+    def test_invoice_with_debt_id(self, now):
         """Test invoice with debt as string ID."""
         invoice_data = {
             "id": "inv_789",
@@ -67,8 +100,8 @@ class TestUpdatedInvoiceModel:
             "currency": "EUR",
             "reference": "INV-2024-002",
             "status": "paid",
-            "created_at": datetime.now().isoformat(),
-            "updated_at": datetime.now().isoformat(),
+            "created_at": now,
+            "updated_at": now,
         }
 
         invoice = Invoice(**invoice_data)
@@ -84,44 +117,27 @@ class TestUpdatedInvoiceModel:
         assert invoice.line_items is None
         assert invoice.metadata is None
 
-    def test_invoice_to_api_body(self):
+    def test_invoice_to_api_body(self, invoice_api_body):
         """Test invoice to_api_body method."""
-        invoice = Invoice(
-            id="inv_123",
-            object="invoice",
-            debt="debt_456",
-            currency="GBP",
-            reference="INV-2024-001",
-            status="outstanding",
-            invoiced_on=date(2024, 1, 15),
-            due_on=date(2024, 2, 15),
-            description="Test invoice",
-            created_at=datetime.now(),
-            updated_at=datetime.now(),
-            metadata={"invoice_type": "standard"},
-        )
-
-        api_body = invoice.to_api_body()
-
         # debt should NOT be in API body (not in __api_body_fields__)
-        assert "debt" not in api_body
+        assert "debt" not in invoice_api_body
         # Server fields should be excluded
-        assert "id" not in api_body
-        assert "object" not in api_body
-        assert "created_at" not in api_body
-        assert "updated_at" not in api_body
+        assert "id" not in invoice_api_body
+        assert "object" not in invoice_api_body
+        assert "created_at" not in invoice_api_body
+        assert "updated_at" not in invoice_api_body
 
         # These fields should be in the API body
-        assert api_body["reference"] == "INV-2024-001"
-        assert api_body["status"] == "outstanding"
-        assert api_body["invoiced_on"] == "2024-01-15"  # Date is serialized as ISO string
-        assert api_body["due_on"] == "2024-02-15"  # Date is serialized as ISO string
-        assert api_body["description"] == "Test invoice"
-        assert api_body["metadata"] == {"invoice_type": "standard"}
-
-    def test_line_item_to_api_body(self):
+        assert invoice_api_body["reference"] == "INV-2024-001"
+        assert invoice_api_body["status"] == "outstanding"
+        assert invoice_api_body["invoiced_on"] == "2024-01-15"  # Date is serialized as ISO string
+        assert invoice_api_body["due_on"] == "2024-02-15"  # Date is serialized as ISO string
+        assert invoice_api_body["description"] == "Test invoice"
+        assert invoice_api_body["metadata"] == {"invoice_type": "standard"}
+
+    def test_line_item_to_api_body(self, now):
         """Test LineItem to_api_body method."""
-        line_item = LineItem(
+        line_item = LineItem.model_construct(
             id="li_123",
             object="line_item",
             debt_id="debt_456",
@@ -129,8 +145,8 @@ class TestUpdatedInvoiceModel:
             description="Debt amount",
             amount=5000,
             currency="GBP",
-            created_at=datetime.now(),
-            updated_at=datetime.now(),
+            created_at=now,
+            updated_at=now,
             metadata={"category": "debt"},
         )
 
@@ -155,36 +171,27 @@ class TestUpdatedInvoiceModel:
 class TestLineItemKindEnum:
     """Test cases for LineItemKind enum."""
 
-    def test_line_item_kind_enum_values(self):
-        """Test LineItemKind enum values."""
-        assert LineItemKind.DEBT == "debt"
-        assert LineItemKind.INTEREST == "interest"
-        assert LineItemKind.FEE == "fee"
-        assert LineItemKind.VAT == "vat"
-        assert LineItemKind.CREDIT == "credit"
-        assert LineItemKind.DISCOUNT == "discount"
-        assert LineItemKind.REFUND == "refund"
-        assert LineItemKind.CREDITOR_REFUND == "creditor_refund"
+    @pytest.mark.parametrize("member,value", _KIND_CASES)
+    def test_line_item_kind_value(self, member, value):
+        """Test each LineItemKind enum member maps to its API value."""
+        assert member == value
 
     def test_line_item_kind_enum_completeness(self):
         """Test that all LineItemKind enum values are defined."""
-        expected_kinds = {"debt", "interest", "fee", "vat", "credit", "discount", "refund", "creditor_refund"}
-
-        actual_kinds = {member.value for member in LineItemKind}
-        assert actual_kinds == expected_kinds
+        assert {member.value for member in LineItemKind} == _EXPECTED_KINDS
 
 
 class TestLineItemModel:
     """Test cases for LineItem model."""
 
-    def test_line_item_creation_with_enum(self):
+    def test_line_item_creation_with_enum(self, now):
         """Test line item creation with enum values."""
         line_item = LineItem(
             kind=LineItemKind.INTEREST,
             description="Interest charge",
             amount=500,
             currency=Currency.GBP,
-            transaction_at=datetime.now(),
+            transaction_at=now,
         )
 
         assert line_item.kind == LineItemKind.INTEREST
@@ -193,11 +200,9 @@ class TestLineItemModel:
         assert line_item.currency == Currency.GBP
         assert isinstance(line_item.transaction_at, datetime)
 
-    def test_line_item_creation_with_string_values(self):
+    def test_line_item_creation_with_string_values(self, now):
         """Test line item creation with string values."""
-        line_item = LineItem(
-            kind="fee", description="Processing fee", amount=100, currency="EUR", transaction_at=datetime.now()
-        )
+        line_item = LineItem(kind="fee", description="Processing fee", amount=100, currency="EUR", transaction_at=now)
 
         assert line_item.kind == "fee"
         assert line_item.description == "Processing fee"
@@ -213,7 +218,7 @@ class TestLineItemModel:
         assert line_item.description is None
         assert line_item.currency is None
 
-    def test_line_item_to_api_body_with_enums(self):
+    def test_line_item_to_api_body_with_enums(self, now):
         """Test line item to_api_body with enum values."""
         line_item = LineItem(
             id="li_456",
@@ -224,9 +229,9 @@ class TestLineItemModel:
             description="VAT charge",
             amount=200,
             currency=Currency.USD,
-            transaction_at=datetime.now(),
-            created_at=datetime.now(),
-            updated_at=datetime.now(),
+            transaction_at=now,
+            created_at=now,
+            updated_at=now,
             metadata={"rate": "20%"},
         )
 
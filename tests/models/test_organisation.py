@@ -57,15 +57,15 @@ class TestOrganisation:
         assert org.metadata is None
         assert org.payment_options_configuration is None
 
-    def test_organisation_creation_with_basic_fields(self):
+    def test_organisation_creation_with_basic_fields(self, now):
         """Test organisation creation with basic fields."""
         org = Organisation(
             id="org_123",
             name="Test Organisation Ltd",
             internal_name="test_org",
             customer_facing_name="Test Org",
-            created_at=datetime.now(),
-            updated_at=datetime.now(),
+            created_at=now,
+            updated_at=now,
         )
 
         assert org.id == "org_123"
@@ -76,27 +76,26 @@ class TestOrganisation:
         assert isinstance(org.created_at, datetime)
         assert isinstance(org.updated_at, datetime)
 
-    def test_organisation_creation_with_all_fields(self):
+    def test_organisation_creation_with_all_fields(self, now):
         """Test organisation creation with all fields."""
-        payment_config = PaymentOptionsConfiguration(
-            pay_later_permitted=True, payment_plans_permitted=True, metadata={"config_version": "2.0"}
-        )
-
-        contact_detail = ContactDetail(type=ContactDetailType.EMAIL, value="contact@testorg.com", primary=True)
-
+        # Nested models are passed as dicts so the whole tree is validated in one pass
         org = Organisation(
             id="org_456",
             object="organisation",
             name="Complete Test Organisation",
             internal_name="complete_test_org",
             customer_facing_name="Complete Test",
-            contact_details=[contact_detail],
+            contact_details=[{"type": "email", "value": "contact@testorg.com", "primary": True}],
             configurations={"feature_flags": {"new_ui": True}},
             deleted_at=None,
-            created_at=datetime.now(),
-            updated_at=datetime.now(),
+            created_at=now,
+            updated_at=now,
             metadata={"industry": "fintech", "size": "medium"},
-            payment_options_configuration=payment_config,
+            payment_options_configuration={
+                "pay_later_permitted": True,
+                "payment_plans_permitted": True,
+                "metadata": {"config_version": "2.0"},
+            },
         )
 
         assert org.id == "org_456"
@@ -110,20 +109,20 @@ class TestOrganisation:
         assert isinstance(org.payment_options_configuration, PaymentOptionsConfiguration)
         assert org.payment_options_configuration.pay_later_permitted is True
 
-    def test_organisation_with_contact_detail_ids(self):
+    def test_organisation_with_contact_detail_ids(self, now):
         """Test organisation with contact details as string IDs."""
         org = Organisation(
             id="org_789",
             name="String Contact Org",
             contact_details=["cd_123", "cd_456"],
-            created_at=datetime.now(),
-            updated_at=datetime.now(),
+            created_at=now,
+            updated_at=now,
         )
 
         assert org.contact_details == ["cd_123", "cd_456"]
         assert all(isinstance(cd, str) for cd in org.contact_details)
 
-    def test_organisation_with_mixed_contact_details(self):
+    def test_organisation_with_mixed_contact_details(self, now):
         """Test organisation with mixed contact details (objects and IDs)."""
         contact_detail = ContactDetail(type=ContactDetailType.PHONE_NUMBER, value="+44123456789", primary=True)
 
@@ -131,8 +130,8 @@ class TestOrganisation:
             id="org_mixed",
             name="Mixed Contact Org",
             contact_details=[contact_detail, "cd_existing_123"],
-            created_at=datetime.now(),
-            updated_at=datetime.now(),
+            created_at=now,
+            updated_at=now,
         )
 
         assert len(org.contact_details) == 2
@@ -140,7 +139,7 @@ class TestOrganisation:
         assert isinstance(org.contact_details[1], str)
         assert org.contact_details[1] == "cd_existing_123"
 
-    def test_organisation_to_api_body_basic(self):
+    def test_organisation_to_api_body_basic(self, now):
         """Test organisation to_api_body with basic fields."""
         org = Organisation(
             id="org_api_basic",
@@ -148,8 +147,8 @@ class TestOrganisation:
             name="API Test Organisation",
             internal_name="api_test_org",
             customer_facing_name="API Test",
-            created_at=datetime.now(),
-            updated_at=datetime.now(),
+            created_at=now,
+            updated_at=now,
         )
 
         api_body = org.to_api_body()
@@ -234,7 +233,7 @@ class TestOrganisation:
         assert "metadata" in api_body
         assert api_body["metadata"] is None
 
-    def test_organisation_with_payment_options_configuration(self):
+    def test_organisation_with_payment_options_configuration(self, now):
         """Test organisation with nested payment options configuration."""
         payment_config = PaymentOptionsConfiguration(
             pay_later_permitted=True, payment_plans_permitted=False, metadata={"version": "1.2"}
@@ -244,8 +243,8 @@ class TestOrganisation:
             id="org_payment_config",
             name="Payment Config Org",
             payment_options_configuration=payment_config,
-            created_at=datetime.now(),
-            updated_at=datetime.now(),
+            created_at=now,
+            updated_at=now,
         )
 
         assert isinstance(org.payment_options_configuration, PaymentOptionsConfiguration)
@@ -277,12 +276,10 @@ class TestOrganisation:
 class TestOrganisationIntegration:
     """Integration tests for Organisation model with other models."""
 
-    def test_organisation_in_debt_context(self):
+    def test_organisation_in_debt_context(self, now):
         """Test organisation model when used in debt context."""
         # This tests the scenario where Organisation is used as a nested object in Debt
-        org = Organisation(
-            id="org_debt_context", name="Debt Context Org", created_at=datetime.now(), updated_at=datetime.now()
-        )
+        org = Organisation(id="org_debt_context", name="Debt Context Org", created_at=now, updated_at=now)
 
         # Simulate how it would be used in debt.to_api_body()
         # When org has a real ID, it should be converted to ID reference
@@ -290,9 +287,7 @@ class TestOrganisationIntegration:
         assert not org.id.startswith("temp_")
 
         # When org has temp ID, it should be included as full object
-        temp_org = Organisation(
-            id="temp_org_123", name="Temp Org", created_at=datetime.now(), updated_at=datetime.now()
-        )
+        temp_org = Organisation(id="temp_org_123", name="Temp Org", created_at=now, updated_at=now)
 
         assert temp_org.id.startswith("temp_")
 
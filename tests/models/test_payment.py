@@ -4,8 +4,60 @@ Unit tests for Payment model.
 
 from datetime import datetime
 
+import pytest
+
 from ophelos_sdk.models import Currency, Debt, Payment, PaymentPlan, PaymentStatus
 
+# Fields Payment may send in create/update requests (mirrors Payment.__api_body_fields__)
+_PAYMENT_API_BODY_FIELDS = frozenset({"transaction_at", "transaction_ref", "amount", "currency", "metadata"})
+
+# Payment fields outside __api_body_fields__; debt is set by the endpoint context
+_NON_BODY_FIELDS = frozenset({"debt", "status", "payment_provider", "payment_plan"})
+
+_EXPECTED_STATUSES = frozenset({"pending", "succeeded", "failed", "disputed", "refunded", "scheduled", "canceled"})
+
+_STATUS_CASES = [
+    (PaymentStatus.PENDING, "pending"),
+    (PaymentStatus.SUCCEEDED, "succeeded"),
+    (PaymentStatus.FAILED, "failed"),
+    (PaymentStatus.DISPUTED, "disputed"),
+    (PaymentStatus.REFUNDED, "refunded"),
+    (PaymentStatus.SCHEDULED, "scheduled"),
+    (PaymentStatus.CANCELED, "canceled"),
+]
+
+
+@pytest.fixture(scope="module")
+def payment_api_body(now):
+    """API body of a fully populated payment, serialized once per module."""
+    payment = Payment(
+        id="pay_123",
+        object="payment",
+        debt="debt_123",
+        status=PaymentStatus.SUCCEEDED,
+        transaction_at=now,
+        transaction_ref="TXN-123",
+        amount=10000,
+        currency="GBP",
+        payment_provider="stripe",
+        created_at=now,
+        updated_at=now,
+        metadata={"gateway_id": "pi_123"},
+    )
+    return payment.to_api_body()
+
+
+@pytest.fixture(scope="module")
+def debt_model():
+    """Expanded debt shared by payment and payment plan tests; tests must not mutate it."""
+    return Debt(id="debt_expanded", customer="cust_123", organisation="org_123")
+
+
+@pytest.fixture(scope="module")
+def payment_plan_model():
+    """Expanded payment plan shared by payment tests; tests must not mutate it."""
+    return PaymentPlan(id="pp_123", status="active")
+
 
 class TestPaymentModel:
     """Test cases for Payment model."""
@@ -19,49 +71,20 @@ class TestPaymentModel:
         assert payment.status == PaymentStatus.SUCCEEDED
         assert payment.debt == sample_payment_data["debt"]
 
-    def test_payment_status_enum(self):
-        """Test payment status enumeration."""
-        assert PaymentStatus.SUCCEEDED == "succeeded"
-        assert PaymentStatus.FAILED == "failed"
-        assert PaymentStatus.PENDING == "pending"
-        assert PaymentStatus.DISPUTED == "disputed"
-
-    def test_payment_to_api_body(self):
+    def test_payment_to_api_body(self, payment_api_body):
         """Test payment to_api_body method."""
-        payment = Payment(
-            id="pay_123",
-            object="payment",
-            debt="debt_123",
-            status=PaymentStatus.SUCCEEDED,
-            transaction_at=datetime.now(),
-            transaction_ref="TXN-123",
-            amount=10000,
-            currency="GBP",
-            payment_provider="stripe",
-            created_at=datetime.now(),
-            updated_at=datetime.now(),
-            metadata={"gateway_id": "pi_123"},
-        )
-
-        api_body = payment.to_api_body()
-
-        # debt should NOT be in API body as it's set by endpoint context
-        assert "debt" not in api_body
-        assert "id" not in api_body
-        assert "object" not in api_body
-        assert "created_at" not in api_body
-        assert "updated_at" not in api_body
-
         # These fields should be in the API body (based on __api_body_fields__)
-        assert api_body["transaction_ref"] == "TXN-123"
-        assert api_body["amount"] == 10000
-        assert api_body["currency"] == "GBP"
-        assert api_body["metadata"] == {"gateway_id": "pi_123"}
-
-        # These fields are NOT in __api_body_fields__ so should be excluded
-        assert "status" not in api_body
-        assert "payment_provider" not in api_body
-        assert "payment_plan" not in api_body
+        assert payment_api_body["transaction_ref"] == "TXN-123"
+        assert payment_api_body["amount"] == 10000
+        assert payment_api_body["currency"] == "GBP"
+        assert payment_api_body["metadata"] == {"gateway_id": "pi_123"}
+        # Nothing outside the allowed request fields leaks into the body
+        assert payment_api_body.keys() <= _PAYMENT_API_BODY_FIELDS
+
+    def test_payment_api_body_excludes_server_fields(self, server_fields, payment_api_body):
+        """Test that payment excludes server and endpoint-context fields from API body."""
+        assert server_fields.isdisjoint(payment_api_body)
+        assert _NON_BODY_FIELDS.isdisjoint(payment_api_body)
 
     def test_payment_creation_with_optional_fields(self):
         """Test payment creation with all fields optional."""
@@ -81,61 +104,25 @@ class TestPaymentModel:
         assert payment_partial.amount is None
         assert payment_partial.currency is None
 
-    def test_payment_partial_update_metadata_only(self):
-        """Test payment model for metadata-only updates."""
-        payment = Payment(metadata={"status": "verified", "notes": "Updated"})
-
-        api_body = payment.to_api_body()
-
-        # Should only contain metadata
-        assert "metadata" in api_body
-        assert api_body["metadata"] == {"status": "verified", "notes": "Updated"}
-
-        # Should not contain other fields
-        assert "transaction_at" not in api_body
-        assert "transaction_ref" not in api_body
-        assert "amount" not in api_body
-        assert "currency" not in api_body
-
-    def test_payment_partial_update_transaction_ref_only(self):
-        """Test payment model for transaction_ref-only updates."""
-        payment = Payment(transaction_ref="UPDATED-REF-123")
-
-        api_body = payment.to_api_body()
-
-        # Should only contain transaction_ref
-        assert "transaction_ref" in api_body
-        assert api_body["transaction_ref"] == "UPDATED-REF-123"
-
-        # Should not contain other fields
-        assert "metadata" not in api_body
-        assert "transaction_at" not in api_body
-        assert "amount" not in api_body
-        assert "currency" not in api_body
-
-    def test_payment_partial_update_multiple_fields(self):
-        """Test payment model for partial updates with multiple fields."""
-        payment = Payment(transaction_ref="MULTI-REF-456", amount=15000, metadata={"source": "partial_update"})
-
-        api_body = payment.to_api_body()
-
-        # Should contain provided fields
-        assert api_body["transaction_ref"] == "MULTI-REF-456"
-        assert api_body["amount"] == 15000
-        assert api_body["metadata"] == {"source": "partial_update"}
-
-        # Should not contain unprovided fields
-        assert "transaction_at" not in api_body
-        assert "currency" not in api_body
-
-    def test_payment_empty_api_body(self):
-        """Test payment model with no fields set produces empty API body."""
-        payment = Payment()
-
-        api_body = payment.to_api_body()
-
-        # Should be empty
-        assert api_body == {}
+    @pytest.mark.parametrize(
+        "kwargs,expected",
+        [
+            (
+                {"metadata": {"status": "verified", "notes": "Updated"}},
+                {"metadata": {"status": "verified", "notes": "Updated"}},
+            ),
+            ({"transaction_ref": "UPDATED-REF-123"}, {"transaction_ref": "UPDATED-REF-123"}),
+            (
+                {"transaction_ref": "MULTI-REF-456", "amount": 15000, "metadata": {"source": "partial_update"}},
+                {"transaction_ref": "MULTI-REF-456", "amount": 15000, "metadata": {"source": "partial_update"}},
+            ),
+            ({}, {}),
+        ],
+        ids=["metadata_only", "transaction_ref_only", "multiple_fields", "empty"],
+    )
+    def test_payment_partial_update_api_body(self, kwargs, expected):
+        """Test that partial payment updates send only the fields that were provided."""
+        assert Payment(**kwargs).to_api_body() == expected
 
     def test_payment_api_body_excludes_none_values(self):
         """Test that to_api_body() excludes None values."""
@@ -157,37 +144,12 @@ class TestPaymentModel:
         assert "metadata" not in api_body
         assert "transaction_at" not in api_body
 
-
-class TestPaymentStatusEnum:
-    """Test cases for PaymentStatus enum."""
-
-    def test_payment_status_enum_completeness(self):
-        """Test that all payment status enum values are defined."""
-        expected_statuses = {"pending", "succeeded", "failed", "disputed", "refunded", "scheduled", "canceled"}
-
-        actual_statuses = {member.value for member in PaymentStatus}
-        assert actual_statuses == expected_statuses
-
-    def test_payment_status_specific_values(self):
-        """Test specific payment status enum values."""
-        assert PaymentStatus.PENDING == "pending"
-        assert PaymentStatus.SUCCEEDED == "succeeded"
-        assert PaymentStatus.FAILED == "failed"
-        assert PaymentStatus.DISPUTED == "disputed"
-        assert PaymentStatus.REFUNDED == "refunded"
-        assert PaymentStatus.SCHEDULED == "scheduled"
-        assert PaymentStatus.CANCELED == "canceled"
-
-
-class TestPaymentModelEnhanced:
-    """Enhanced test cases for Payment model."""
-
-    def test_payment_creation_with_enums(self):
+    def test_payment_creation_with_enums(self, now):
         """Test payment creation with enum values."""
         payment = Payment(
             id="pay_enum_test",
             status=PaymentStatus.SUCCEEDED,
-            transaction_at=datetime.now(),
+            transaction_at=now,
             transaction_ref="TXN-ENUM-001",
             amount=15000,
             currency=Currency.EUR,
@@ -199,37 +161,33 @@ class TestPaymentModelEnhanced:
         assert payment.amount == 15000
         assert payment.transaction_ref == "TXN-ENUM-001"
 
-    def test_payment_with_debt_model(self):
+    def test_payment_with_debt_model(self, now, debt_model):
         """Test payment with expanded Debt model."""
-        debt_model = Debt(id="debt_payment_test", customer="cust_123", organisation="org_123")
-
         payment = Payment(
             id="pay_debt_model",
             debt=debt_model,
             status=PaymentStatus.PENDING,
-            transaction_at=datetime.now(),
+            transaction_at=now,
             transaction_ref="TXN-DEBT-001",
             amount=8000,
             currency=Currency.GBP,
         )
 
         assert isinstance(payment.debt, Debt)
-        assert payment.debt.id == "debt_payment_test"
+        assert payment.debt.id == "debt_expanded"
 
         # API body should not include debt field
         api_body = payment.to_api_body()
         assert "debt" not in api_body
 
-    def test_payment_with_payment_plan_model(self):
+    def test_payment_with_payment_plan_model(self, now, payment_plan_model):
         """Test payment with PaymentPlan model."""
-        payment_plan = PaymentPlan(id="pp_123", status="active")
-
         payment = Payment(
             id="pay_plan_test",
             debt="debt_456",
-            payment_plan=payment_plan,
+            payment_plan=payment_plan_model,
             status=PaymentStatus.SCHEDULED,
-            transaction_at=datetime.now(),
+            transaction_at=now,
             transaction_ref="TXN-PLAN-001",
             amount=2500,
             currency=Currency.USD,
@@ -239,15 +197,20 @@ class TestPaymentModelEnhanced:
         assert payment.payment_plan.id == "pp_123"
         assert payment.status == PaymentStatus.SCHEDULED
 
-    def test_payment_to_api_body_with_currency_enum(self):
-        """Test payment to_api_body with Currency enum."""
+    @pytest.mark.parametrize(
+        "currency,expected",
+        [("GBP", "GBP"), (Currency.GBP, "GBP"), (Currency.USD, "USD")],
+        ids=["str", "enum_gbp", "enum_usd"],
+    )
+    def test_payment_to_api_body_currency(self, now, currency, expected):
+        """Test payment to_api_body serializes string and Currency enum values alike."""
         payment = Payment(
             id="pay_currency_test",
             status=PaymentStatus.SUCCEEDED,
-            transaction_at=datetime.now(),
+            transaction_at=now,
             transaction_ref="TXN-CURRENCY-001",
             amount=12000,
-            currency=Currency.USD,
+            currency=currency,
             metadata={"processor": "stripe", "fee": 300},
         )
 
@@ -255,13 +218,11 @@ class TestPaymentModelEnhanced:
 
         assert api_body["transaction_ref"] == "TXN-CURRENCY-001"
         assert api_body["amount"] == 12000
-        assert api_body["currency"] == "USD"  # Enum serialized as string
+        assert api_body["currency"] == expected  # Enum serialized as string
         assert api_body["metadata"] == {"processor": "stripe", "fee": 300}
 
         # Fields not in __api_body_fields__ should be excluded
-        assert "status" not in api_body
-        assert "payment_provider" not in api_body
-        assert "payment_plan" not in api_body
+        assert _NON_BODY_FIELDS.isdisjoint(api_body)
 
     def test_payment_datetime_serialization_in_api_body(self):
         """Test that datetime fields are properly serialized in to_api_body."""
@@ -278,8 +239,7 @@ class TestPaymentModelEnhanced:
         api_body = payment.to_api_body()
 
         # Datetime should be serialized as ISO format string
-        assert isinstance(api_body["transaction_at"], str)
-        assert "2024-03-15T14:30:00" in api_body["transaction_at"]
+        assert api_body["transaction_at"] == "2024-03-15T14:30:00"
 
     def test_payment_full_create_vs_partial_update_scenarios(self):
         """Test the difference between full create and partial update scenarios."""
@@ -294,12 +254,8 @@ class TestPaymentModelEnhanced:
 
         create_body = payment_create.to_api_body()
 
-        # Should contain all provided fields
-        assert "transaction_at" in create_body
-        assert "transaction_ref" in create_body
-        assert "amount" in create_body
-        assert "currency" in create_body
-        assert "metadata" in create_body
+        # Should contain every request field
+        assert create_body.keys() == _PAYMENT_API_BODY_FIELDS
 
         # Partial update scenario
         payment_update = Payment(metadata={"source": "update_operation"})
@@ -312,6 +268,19 @@ class TestPaymentModelEnhanced:
         assert update_body["metadata"] == {"source": "update_operation"}
 
 
+class TestPaymentStatusEnum:
+    """Test cases for PaymentStatus enum."""
+
+    def test_payment_status_enum_completeness(self):
+        """Test that all payment status enum values are defined."""
+        assert {member.value for member in PaymentStatus} == _EXPECTED_STATUSES
+
+    @pytest.mark.parametrize("member,value", _STATUS_CASES)
+    def test_payment_status_value(self, member, value):
+        """Test each payment status enum member maps to its API value."""
+        assert member == value
+
+
 class TestPaymentPlan:
     """Test cases for PaymentPlan model."""
 
@@ -328,15 +297,15 @@ class TestPaymentPlan:
         assert plan.updated_at is None
         assert plan.metadata is None
 
-    def test_payment_plan_creation_with_fields(self):
+    def test_payment_plan_creation_with_fields(self, now):
         """Test payment plan creation with fields."""
         plan = PaymentPlan(
             id="pp_456",
             debt="debt_789",
             status="active",
             schedule=["schedule_1", "schedule_2"],
-            created_at=datetime.now(),
-            updated_at=datetime.now(),
+            created_at=now,
+            updated_at=now,
             metadata={"type": "installment", "frequency": "monthly"},
         )
 
@@ -346,14 +315,10 @@ class TestPaymentPlan:
         assert plan.schedule == ["schedule_1", "schedule_2"]
         assert plan.metadata == {"type": "installment", "frequency": "monthly"}
 
-    def test_payment_plan_with_debt_model(self):
+    def test_payment_plan_with_debt_model(self, now, debt_model):
         """Test payment plan with expanded Debt model."""
-        debt_model = Debt(id="debt_plan_test", customer="cust_456", organisation="org_456")
-
-        plan = PaymentPlan(
-            id="pp_debt_model", debt=debt_model, status="pending", created_at=datetime.now(), updated_at=datetime.now()
-        )
+        plan = PaymentPlan(id="pp_debt_model", debt=debt_model, status="pending", created_at=now, updated_at=now)
 
         assert isinstance(plan.debt, Debt)
-        assert plan.debt.id == "debt_plan_test"
+        assert plan.debt.id == "debt_expanded"
         assert plan.status == "pending"
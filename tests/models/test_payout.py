@@ -2,10 +2,33 @@
 Unit tests for Payout model.
 """
 
-from datetime import date, datetime
+from datetime import date
+
+import pytest
 
 from ophelos_sdk.models import Currency, Payout
 
+_PAYOUT_DATE = date(2024, 6, 1)
+_PAYOUT_DATE_ISO = _PAYOUT_DATE.isoformat()
+
+
+@pytest.fixture(scope="module")
+def payout_api_body(now):
+    """API body of a fully populated payout, serialized once per module."""
+    payout = Payout(
+        id="payout_api_test",
+        object="payout",
+        amount=60000,
+        currency=Currency.GBP,
+        status="processing",
+        payout_date=_PAYOUT_DATE,
+        organisation_id="org_api_test",
+        created_at=now,
+        updated_at=now,
+        metadata={"priority": "high"},
+    )
+    return payout.to_api_body()
+
 
 class TestPayout:
     """Test cases for Payout model."""
@@ -25,11 +48,9 @@ class TestPayout:
         assert payout.created_at is None
         assert payout.updated_at is None
 
-    def test_payout_creation_with_all_fields(self):
+    def test_payout_creation_with_all_fields(self, now):
         """Test payout creation with all fields."""
         payout_date = date(2024, 4, 15)
-        created_time = datetime.now()
-        updated_time = datetime.now()
 
         payout = Payout(
             id="payout_123",
@@ -40,8 +61,8 @@ class TestPayout:
             payout_date=payout_date,
             organisation_id="org_456",
             metadata={"batch_id": "batch_001", "region": "UK"},
-            created_at=created_time,
-            updated_at=updated_time,
+            created_at=now,
+            updated_at=now,
         )
 
         assert payout.id == "payout_123"
@@ -52,57 +73,46 @@ class TestPayout:
         assert payout.payout_date == payout_date
         assert payout.organisation_id == "org_456"
         assert payout.metadata == {"batch_id": "batch_001", "region": "UK"}
-        assert payout.created_at == created_time
-        assert payout.updated_at == updated_time
-
-    def test_payout_with_currency_enum(self):
-        """Test payout creation with Currency enum."""
-        payout = Payout(amount=100000, currency=Currency.EUR, status="completed", organisation_id="org_789")
-
-        assert payout.amount == 100000
-        assert payout.currency == Currency.EUR
-        assert payout.status == "completed"
-        assert payout.organisation_id == "org_789"
-
-    def test_payout_with_currency_string(self):
-        """Test payout creation with currency as string."""
-        payout = Payout(amount=25000, currency="USD", status="failed", payout_date=date(2024, 5, 1))
-
-        assert payout.amount == 25000
-        assert payout.currency == "USD"
-        assert payout.status == "failed"
-        assert payout.payout_date == date(2024, 5, 1)
-
-    def test_payout_to_api_body_basic(self):
+        assert payout.created_at == now
+        assert payout.updated_at == now
+
+    @pytest.mark.parametrize(
+        "kwargs,expected",
+        [
+            pytest.param(
+                {"amount": 100000, "currency": Currency.EUR, "status": "completed", "organisation_id": "org_789"},
+                {"amount": 100000, "currency": "EUR", "status": "completed", "organisation_id": "org_789"},
+                id="enum",
+            ),
+            pytest.param(
+                {"amount": 25000, "currency": "USD", "status": "failed", "payout_date": date(2024, 5, 1)},
+                {"amount": 25000, "currency": "USD", "status": "failed", "payout_date": date(2024, 5, 1)},
+                id="str",
+            ),
+        ],
+    )
+    def test_payout_currency_input(self, kwargs, expected):
+        """Test payout creation with the currency given as a Currency enum or a string."""
+        payout = Payout(**kwargs)
+
+        for field, value in expected.items():
+            assert getattr(payout, field) == value
+        # Enum inputs are stored as their plain string value
+        assert type(payout.currency) is str
+
+    def test_payout_to_api_body_basic(self, payout_api_body):
         """Test payout to_api_body with basic fields."""
-        payout = Payout(
-            id="payout_api_test",
-            object="payout",
-            amount=60000,
-            currency=Currency.GBP,
-            status="processing",
-            payout_date=date(2024, 6, 1),
-            organisation_id="org_api_test",
-            created_at=datetime.now(),
-            updated_at=datetime.now(),
-            metadata={"priority": "high"},
-        )
-
-        api_body = payout.to_api_body()
-
-        # Server fields should be excluded
-        assert "id" not in api_body
-        assert "object" not in api_body
-        assert "created_at" not in api_body
-        assert "updated_at" not in api_body
-
         # Status is typically server-managed, so might not be in API body
         # But amount, currency, payout_date, organisation_id, metadata should be included
-        assert api_body["amount"] == 60000
-        assert api_body["currency"] == "GBP"  # Enum serialized as string
-        assert api_body["payout_date"] == "2024-06-01"  # Date serialized as ISO string
-        assert api_body["organisation_id"] == "org_api_test"
-        assert api_body["metadata"] == {"priority": "high"}
+        assert payout_api_body["amount"] == 60000
+        assert payout_api_body["currency"] == "GBP"  # Enum serialized as string
+        assert payout_api_body["payout_date"] == _PAYOUT_DATE_ISO  # Date serialized as ISO string
+        assert payout_api_body["organisation_id"] == "org_api_test"
+        assert payout_api_body["metadata"] == {"priority": "high"}
+
+    def test_payout_api_body_excludes_server_fields(self, server_fields, payout_api_body):
+        """Test that payout excludes server fields from API body."""
+        assert server_fields.isdisjoint(payout_api_body)
 
     def test_payout_to_api_body_minimal(self):
         """Test payout to_api_body with minimal fields."""
@@ -158,12 +168,10 @@ class TestPayout:
         api_body = payout.to_api_body()
         assert api_body["amount"] == large_amount
 
-    def test_payout_status_values(self):
+    @pytest.mark.parametrize("status", ["pending", "processing", "completed", "failed", "cancelled"])
+    def test_payout_status_values(self, status):
         """Test payout with different status values."""
-        statuses = ["pending", "processing", "completed", "failed", "cancelled"]
-
-        for status in statuses:
-            payout = Payout(amount=50000, status=status, organisation_id=f"org_{status}")
+        payout = Payout(amount=50000, status=status, organisation_id=f"org_{status}")
 
-            assert payout.status == status
-            assert payout.organisation_id == f"org_{status}"
+        assert payout.status == status
+        assert payout.organisation_id == f"org_{status}"
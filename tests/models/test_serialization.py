@@ -2,8 +2,6 @@
 Unit tests for model serialization and deserialization.
 """
 
-from datetime import datetime
-
 from ophelos_sdk.models import Debt
 
 
@@ -21,31 +19,23 @@ class TestModelSerialization:
         assert debt_dict["summary"]["amount_total"] == sample_debt_data["summary"]["amount_total"]
         assert debt_dict["status"]["value"] == sample_debt_data["status"]["value"]
 
-    def test_model_extra_fields(self):
+    def test_model_extra_fields(self, now, prepared_status):
         """Test that models accept extra fields (for API compatibility)."""
-        created_at = datetime.now()
-        updated_at = datetime.now()
         debt_data = {
             "id": "debt_123",
             "object": "debt",
-            "status": {
-                "value": "prepared",
-                "whodunnit": "system",
-                "context": None,
-                "reason": None,
-                "updated_at": updated_at.isoformat(),
-            },
+            "status": prepared_status,
             "customer": "cust_123",
             "organisation": "org_123",
             "summary": {"amount_total": 10000, "amount_paid": 0, "amount_remaining": 10000},
-            "created_at": created_at,
-            "updated_at": updated_at,
+            "created_at": now,
+            "updated_at": now,
             "unknown_field": "should_be_accepted",  # Extra field
         }
 
         # Should not raise an error due to extra="allow" in BaseOphelosModel
         debt = Debt(**debt_data)
         assert debt.id == "debt_123"
-        # Extra field should be accessible
-        assert hasattr(debt, "unknown_field")
+        # Extra field should be stored as an extra and accessible as an attribute
+        assert debt.__pydantic_extra__["unknown_field"] == "should_be_accepted"
         assert debt.unknown_field == "should_be_accepted"
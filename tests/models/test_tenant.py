@@ -2,10 +2,47 @@
 Unit tests for Tenant model.
 """
 
-from datetime import datetime
+import copy
+from types import MappingProxyType
+
+import pytest
 
 from ophelos_sdk.models import Tenant
 
+# Frozen at the top level; models get a deep copy so nested values are never shared
+_COMPLEX_TENANT_CONFIGURATIONS = MappingProxyType(
+    {
+        "api_version": "v2",
+        "rate_limits": {"requests_per_minute": 1000, "burst_limit": 50},
+        "integrations": ["webhook", "email", "sms"],
+        "features": {"advanced_reporting": True, "custom_branding": False, "multi_currency": True},
+    }
+)
+
+_CONFIG_CASES = (
+    {"simple": "value"},
+    {"nested": {"key": "value"}},
+    {"list": [1, 2, 3]},
+    {"mixed": {"string": "value", "number": 123, "boolean": True}},
+    {"empty": {}},
+)
+
+
+@pytest.fixture(scope="module")
+def tenant_api_body(now):
+    """API body of a fully populated tenant, built without validation and serialized once per module."""
+    tenant = Tenant.model_construct(
+        id="tenant_api_test",
+        object="tenant",
+        name="API Test Tenant",
+        description="Tenant for API body testing",
+        configurations={"test_mode": True},
+        metadata={"test": True, "priority": "high"},
+        created_at=now,
+        updated_at=now,
+    )
+    return tenant.to_api_body()
+
 
 class TestTenant:
     """Test cases for Tenant model."""
@@ -23,10 +60,8 @@ class TestTenant:
         assert tenant.created_at is None
         assert tenant.updated_at is None
 
-    def test_tenant_creation_with_all_fields(self):
+    def test_tenant_creation_with_all_fields(self, now):
         """Test tenant creation with all fields."""
-        created_time = datetime.now()
-        updated_time = datetime.now()
 
         tenant = Tenant(
             id="tenant_123",
@@ -35,8 +70,8 @@ class TestTenant:
             description="A comprehensive test tenant for testing purposes",
             configurations={"api_version": "v2", "features": ["feature_a", "feature_b"]},
             metadata={"environment": "test", "region": "eu-west-1"},
-            created_at=created_time,
-            updated_at=updated_time,
+            created_at=now,
+            updated_at=now,
         )
 
         assert tenant.id == "tenant_123"
@@ -45,57 +80,35 @@ class TestTenant:
         assert tenant.description == "A comprehensive test tenant for testing purposes"
         assert tenant.configurations == {"api_version": "v2", "features": ["feature_a", "feature_b"]}
         assert tenant.metadata == {"environment": "test", "region": "eu-west-1"}
-        assert tenant.created_at == created_time
-        assert tenant.updated_at == updated_time
+        assert tenant.created_at == now
+        assert tenant.updated_at == now
 
     def test_tenant_with_complex_metadata(self):
         """Test tenant creation with complex metadata."""
-        complex_configurations = {
-            "api_version": "v2",
-            "rate_limits": {"requests_per_minute": 1000, "burst_limit": 50},
-            "integrations": ["webhook", "email", "sms"],
-            "features": {"advanced_reporting": True, "custom_branding": False, "multi_currency": True},
-        }
-
         tenant = Tenant(
             name="Complex Tenant",
             description="Tenant with complex configurations",
-            configurations=complex_configurations,
+            configurations=copy.deepcopy(dict(_COMPLEX_TENANT_CONFIGURATIONS)),
             metadata={"environment": "test"},
         )
 
         assert tenant.name == "Complex Tenant"
-        assert tenant.configurations == complex_configurations
+        assert tenant.configurations == _COMPLEX_TENANT_CONFIGURATIONS
         assert tenant.configurations["api_version"] == "v2"
         assert tenant.configurations["features"]["advanced_reporting"] is True
         assert tenant.metadata == {"environment": "test"}
 
-    def test_tenant_to_api_body_basic(self):
+    def test_tenant_to_api_body_basic(self, tenant_api_body):
         """Test tenant to_api_body with basic fields."""
-        tenant = Tenant(
-            id="tenant_api_test",
-            object="tenant",
-            name="API Test Tenant",
-            description="Tenant for API body testing",
-            configurations={"test_mode": True},
-            metadata={"test": True, "priority": "high"},
-            created_at=datetime.now(),
-            updated_at=datetime.now(),
-        )
-
-        api_body = tenant.to_api_body()
-
-        # Server fields should be excluded
-        assert "id" not in api_body
-        assert "object" not in api_body
-        assert "created_at" not in api_body
-        assert "updated_at" not in api_body
-
         # Client fields should be included
-        assert api_body["name"] == "API Test Tenant"
-        assert api_body["description"] == "Tenant for API body testing"
-        assert api_body["configurations"] == {"test_mode": True}
-        assert api_body["metadata"] == {"test": True, "priority": "high"}
+        assert tenant_api_body["name"] == "API Test Tenant"
+        assert tenant_api_body["description"] == "Tenant for API body testing"
+        assert tenant_api_body["configurations"] == {"test_mode": True}
+        assert tenant_api_body["metadata"] == {"test": True, "priority": "high"}
+
+    def test_tenant_api_body_excludes_server_fields(self, server_fields, tenant_api_body):
+        """Test that tenant excludes server fields from API body."""
+        assert server_fields.isdisjoint(tenant_api_body)
 
     def test_tenant_to_api_body_exclude_none_false(self):
         """Test tenant to_api_body includes None values when exclude_none=False."""
@@ -112,23 +125,15 @@ class TestTenant:
         # Empty dict should be included
         assert api_body["configurations"] == {}
 
-    def test_tenant_configurations_formats(self):
+    @pytest.mark.parametrize("config", _CONFIG_CASES, ids=["simple", "nested", "list", "mixed", "empty"])
+    def test_tenant_configurations_formats(self, config):
         """Test tenant with different configuration formats."""
-        config_cases = [
-            {"simple": "value"},
-            {"nested": {"key": "value"}},
-            {"list": [1, 2, 3]},
-            {"mixed": {"string": "value", "number": 123, "boolean": True}},
-            {"empty": {}},
-        ]
+        tenant = Tenant(name="Test Tenant", configurations=config)
 
-        for config in config_cases:
-            tenant = Tenant(name="Test Tenant", configurations=config)
+        assert tenant.configurations == config
 
-            assert tenant.configurations == config
-
-            api_body = tenant.to_api_body()
-            assert api_body["configurations"] == config
+        api_body = tenant.to_api_body()
+        assert api_body["configurations"] == config
 
     def test_tenant_long_description(self):
         """Test tenant with long description."""
@@ -156,9 +161,10 @@ class TestTenant:
         api_body = tenant.to_api_body()
         assert api_body["metadata"] == {}
 
-    def test_tenant_name_variations(self):
-        """Test tenant with various name formats."""
-        name_cases = [
+    @pytest.mark.slow
+    @pytest.mark.parametrize(
+        "name",
+        [
             "Simple Name",
             "Name with Numbers 123",
             "Name-with-Hyphens",
@@ -167,16 +173,19 @@ class TestTenant:
             "Very Long Tenant Name That Might Be Used In Real World Scenarios",
             "短い名前",  # Short name in Japanese
             "Nom avec accents éàù",  # Name with accents
-        ]
-
-        for name in name_cases:
-            tenant = Tenant(name=name)
+        ],
+        ids=["simple", "numbers", "hyphens", "underscores", "special", "long", "japanese", "accents"],
+    )
+    def test_tenant_name_variations(self, name):
+        """Test tenant with various name formats."""
+        tenant = Tenant(name=name)
 
-            assert tenant.name == name
+        assert tenant.name == name
 
-            api_body = tenant.to_api_body()
-            assert api_body["name"] == name
+        api_body = tenant.to_api_body()
+        assert api_body["name"] == name
 
+    @pytest.mark.slow
     def test_tenant_metadata_serialization(self):
         """Test that complex metadata is properly serialized in API body."""
         metadata = {
@@ -0,0 +1,64 @@
+"""
+Shared fixtures for resource tests.
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from ophelos_sdk.resources import (
+    ContactDetailsResource,
+    CustomersResource,
+    DebtsResource,
+    InvoicesResource,
+    LineItemsResource,
+    PaymentsResource,
+)
+
+
+@pytest.fixture
+def debts_resource(mock_http_client):
+    """Create debts resource for testing."""
+    return DebtsResource(mock_http_client)
+
+
+@pytest.fixture
+def customers_resource(mock_http_client):
+    """Create customers resource for testing."""
+    return CustomersResource(mock_http_client)
+
+
+@pytest.fixture
+def contact_details_resource(mock_http_client):
+    """Create contact details resource for testing."""
+    return ContactDetailsResource(mock_http_client)
+
+
+@pytest.fixture
+def payments_resource(mock_http_client):
+    """Create payments resource for testing."""
+    return PaymentsResource(mock_http_client)
+
+
+@pytest.fixture
+def line_items_resource(mock_http_client):
+    """Create line items resource for testing."""
+    return LineItemsResource(mock_http_client)
+
+
+@pytest.fixture
+def invoices_resource(mock_http_client):
+    """Create invoices resource for testing."""
+    return InvoicesResource(mock_http_client)
+
+
+@pytest.fixture(scope="session")
+def ok_response():
+    """Stand-in for a 200 requests.Response; resources only attach it to parsed models."""
+    return SimpleNamespace(status_code=200)
+
+
+@pytest.fixture(scope="session")
+def created_response():
+    """Stand-in for a 201 requests.Response; resources only attach it to parsed models."""
+    return SimpleNamespace(status_code=201)
@@ -2,27 +2,10 @@
 Unit tests for base resource functionality.
 """
 
-from unittest.mock import Mock
-
-import pytest
-
-from ophelos_sdk.http_client import HTTPClient
-from ophelos_sdk.resources import DebtsResource
-
 
 class TestBaseResource:
     """Test cases for base resource functionality."""
 
-    @pytest.fixture
-    def mock_http_client(self):
-        """Mock HTTP client for testing."""
-        return Mock(spec=HTTPClient)
-
-    @pytest.fixture
-    def debts_resource(self, mock_http_client):
-        """Create debts resource for testing."""
-        return DebtsResource(mock_http_client)
-
     def test_build_expand_params(self, debts_resource):
         """Test building expand parameters."""
         # No expand fields
@@ -2,235 +2,195 @@
 Unit tests for contact details resource.
 """
 
-from unittest.mock import Mock
+from types import MappingProxyType
 
 import pytest
 
-from ophelos_sdk.http_client import HTTPClient
 from ophelos_sdk.models import ContactDetail, PaginatedResponse
-from ophelos_sdk.resources import ContactDetailsResource
+
+_SAMPLE_CONTACT_DETAIL = MappingProxyType(
+    {
+        "id": "cd_123456789",
+        "object": "contact_detail",
+        "type": "email",
+        "value": "test@example.com",
+        "primary": True,
+        "usage": "permanent",
+        "source": "client",
+        "status": "active",
+        "created_at": "2024-01-15T10:00:00Z",
+        "updated_at": "2024-01-15T10:00:00Z",
+        "metadata": {"verified": True},
+    }
+)
+
+_CUSTOMER_ID = "cust_123"
+_CONTACT_DETAIL_ID = "cd_123456789"
+_CONTACT_DETAILS_PATH = f"customers/{_CUSTOMER_ID}/contact_details"
+_CONTACT_DETAIL_PATH = f"{_CONTACT_DETAILS_PATH}/{_CONTACT_DETAIL_ID}"
+
+_CREATE_DATA = {"type": "email", "value": "test@example.com", "primary": True, "usage": "permanent", "source": "client"}
+
+# Model payloads and the bodies they serialize to, built once at import
+_CREATE_MODEL = ContactDetail(type="email", value="model@example.com", primary=True, usage="permanent")
+_CREATE_MODEL_BODY = _CREATE_MODEL.to_api_body()
+_UPDATE_MODEL = ContactDetail(type="email", value="updated@example.com", primary=False, status="verified")
+_UPDATE_MODEL_BODY = _UPDATE_MODEL.to_api_body()
 
 
 class TestContactDetailsResource:
     """Test cases for contact details resource."""
 
-    @pytest.fixture
-    def mock_http_client(self):
-        """Mock HTTP client for testing."""
-        return Mock(spec=HTTPClient)
-
-    @pytest.fixture
-    def contact_details_resource(self, mock_http_client):
-        """Create contact details resource for testing."""
-        return ContactDetailsResource(mock_http_client)
-
     @pytest.fixture
     def sample_contact_detail_data(self):
-        """Sample contact detail data for testing."""
-        return {
-            "id": "cd_123456789",
-            "object": "contact_detail",
-            "type": "email",
-            "value": "test@example.com",
-            "primary": True,
-            "usage": "permanent",
-            "source": "client",
-            "status": "active",
-            "created_at": "2024-01-15T10:00:00Z",
-            "updated_at": "2024-01-15T10:00:00Z",
-            "metadata": {"verified": True},
-        }
-
-    def test_create_contact_detail(self, contact_details_resource, mock_http_client, sample_contact_detail_data):
-        """Test creating a contact detail."""
-        create_data = {
-            "type": "email",
-            "value": "test@example.com",
-            "primary": True,
-            "usage": "permanent",
-            "source": "client",
-        }
-        mock_response = Mock()
-        mock_response.status_code = 201
-        mock_http_client.post.return_value = (sample_contact_detail_data, mock_response)
-
-        result = contact_details_resource.create("cust_123", create_data)
-
-        mock_http_client.post.assert_called_once_with(
-            "customers/cust_123/contact_details", data=create_data, return_response=True
-        )
-        assert isinstance(result, ContactDetail)
-        assert result.id == sample_contact_detail_data["id"]
-
-    def test_create_contact_detail_with_expand(
-        self, contact_details_resource, mock_http_client, sample_contact_detail_data
-    ):
-        """Test creating a contact detail with expand parameters."""
-        create_data = {"type": "phone_number", "value": "+44123456789"}
-        mock_response = Mock()
-        mock_response.status_code = 201
-        mock_http_client.post.return_value = (sample_contact_detail_data, mock_response)
-
-        result = contact_details_resource.create("cust_123", create_data, expand=["customer"])
-
-        mock_http_client.post.assert_called_once_with(
-            "customers/cust_123/contact_details",
-            data=create_data,
-            params={"expand[]": ["customer"]},
-            return_response=True,
-        )
-        assert isinstance(result, ContactDetail)
-
-    def test_create_contact_detail_with_model(
-        self, contact_details_resource, mock_http_client, sample_contact_detail_data
+        """Sample contact detail data for testing, copied per test because resource parsing injects _req_res."""
+        return dict(_SAMPLE_CONTACT_DETAIL)
+
+    @pytest.mark.parametrize(
+        "payload,expand,expected_data",
+        [
+            pytest.param(_CREATE_DATA, None, _CREATE_DATA, id="dict"),
+            pytest.param(
+                {"type": "phone_number", "value": "+44123456789"},
+                ["customer"],
+                {"type": "phone_number", "value": "+44123456789"},
+                id="expand",
+            ),
+            # Model instances are sent through to_api_body()
+            pytest.param(_CREATE_MODEL, None, _CREATE_MODEL_BODY, id="model"),
+        ],
+    )
+    def test_create_contact_detail(
+        self,
+        contact_details_resource,
+        mock_http_client,
+        created_response,
+        sample_contact_detail_data,
+        payload,
+        expand,
+        expected_data,
     ):
-        """Test creating a contact detail using ContactDetail model instance."""
-        contact_detail = ContactDetail(type="email", value="model@example.com", primary=True, usage="permanent")
-        mock_response = Mock()
-        mock_response.status_code = 201
-        mock_http_client.post.return_value = (sample_contact_detail_data, mock_response)
+        """Test creating a contact detail from a dict or a ContactDetail model, with and without expand."""
+        mock_http_client.post.return_value = (sample_contact_detail_data, created_response)
 
-        result = contact_details_resource.create("cust_123", contact_detail)
+        result = contact_details_resource.create(_CUSTOMER_ID, payload, expand=expand)
 
-        # Should call to_api_body() on the model
-        expected_data = contact_detail.to_api_body()
+        expected_params = {"params": {"expand[]": expand}} if expand else {}
         mock_http_client.post.assert_called_once_with(
-            "customers/cust_123/contact_details", data=expected_data, return_response=True
-        )
-        assert isinstance(result, ContactDetail)
-
-    def test_update_contact_detail(self, contact_details_resource, mock_http_client, sample_contact_detail_data):
-        """Test updating a contact detail."""
-        update_data = {"status": "verified", "primary": False}
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_http_client.put.return_value = (sample_contact_detail_data, mock_response)
-
-        result = contact_details_resource.update("cust_123", "cd_123456789", update_data)
-
-        mock_http_client.put.assert_called_once_with(
-            "customers/cust_123/contact_details/cd_123456789", data=update_data, return_response=True
+            _CONTACT_DETAILS_PATH, data=expected_data, **expected_params, return_response=True
         )
         assert isinstance(result, ContactDetail)
         assert result.id == sample_contact_detail_data["id"]
 
-    def test_update_contact_detail_with_expand(
-        self, contact_details_resource, mock_http_client, sample_contact_detail_data
+    @pytest.mark.parametrize(
+        "payload,expand,expected_data",
+        [
+            pytest.param(
+                {"status": "verified", "primary": False}, None, {"status": "verified", "primary": False}, id="dict"
+            ),
+            pytest.param({"status": "inactive"}, ["customer"], {"status": "inactive"}, id="expand"),
+            # Model instances are sent through to_api_body()
+            pytest.param(_UPDATE_MODEL, None, _UPDATE_MODEL_BODY, id="model"),
+        ],
+    )
+    def test_update_contact_detail(
+        self,
+        contact_details_resource,
+        mock_http_client,
+        ok_response,
+        sample_contact_detail_data,
+        payload,
+        expand,
+        expected_data,
     ):
-        """Test updating a contact detail with expand parameters."""
-        update_data = {"status": "inactive"}
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_http_client.put.return_value = (sample_contact_detail_data, mock_response)
+        """Test updating a contact detail from a dict or a ContactDetail model, with and without expand."""
+        mock_http_client.put.return_value = (sample_contact_detail_data, ok_response)
 
-        result = contact_details_resource.update("cust_123", "cd_123456789", update_data, expand=["customer"])
+        result = contact_details_resource.update(_CUSTOMER_ID, _CONTACT_DETAIL_ID, payload, expand=expand)
 
+        expected_params = {"params": {"expand[]": expand}} if expand else {}
         mock_http_client.put.assert_called_once_with(
-            "customers/cust_123/contact_details/cd_123456789",
-            data=update_data,
-            params={"expand[]": ["customer"]},
+            _CONTACT_DETAIL_PATH,
+            data=expected_data,
+            **expected_params,
             return_response=True,
         )
         assert isinstance(result, ContactDetail)
+        assert result.id == sample_contact_detail_data["id"]
 
-    def test_update_contact_detail_with_model(
-        self, contact_details_resource, mock_http_client, sample_contact_detail_data
+    def test_get_contact_detail(
+        self, contact_details_resource, mock_http_client, ok_response, sample_contact_detail_data
     ):
-        """Test updating a contact detail using ContactDetail model instance."""
-        contact_detail = ContactDetail(type="email", value="updated@example.com", primary=False, status="verified")
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_http_client.put.return_value = (sample_contact_detail_data, mock_response)
-
-        result = contact_details_resource.update("cust_123", "cd_123456789", contact_detail)
-
-        # Should call to_api_body() on the model
-        expected_data = contact_detail.to_api_body()
-        mock_http_client.put.assert_called_once_with(
-            "customers/cust_123/contact_details/cd_123456789", data=expected_data, return_response=True
-        )
-        assert isinstance(result, ContactDetail)
-
-    def test_get_contact_detail(self, contact_details_resource, mock_http_client, sample_contact_detail_data):
         """Test getting a specific contact detail."""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_http_client.get.return_value = (sample_contact_detail_data, mock_response)
+        mock_http_client.get.return_value = (sample_contact_detail_data, ok_response)
 
-        result = contact_details_resource.get("cust_123", "cd_123456789")
+        result = contact_details_resource.get(_CUSTOMER_ID, _CONTACT_DETAIL_ID)
 
-        mock_http_client.get.assert_called_once_with(
-            "customers/cust_123/contact_details/cd_123456789", params={}, return_response=True
-        )
+        mock_http_client.get.assert_called_once_with(_CONTACT_DETAIL_PATH, params={}, return_response=True)
         assert isinstance(result, ContactDetail)
         assert result.id == sample_contact_detail_data["id"]
 
     def test_get_contact_detail_with_expand(
-        self, contact_details_resource, mock_http_client, sample_contact_detail_data
+        self, contact_details_resource, mock_http_client, ok_response, sample_contact_detail_data
     ):
         """Test getting a contact detail with expand parameters."""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_http_client.get.return_value = (sample_contact_detail_data, mock_response)
+        mock_http_client.get.return_value = (sample_contact_detail_data, ok_response)
 
-        result = contact_details_resource.get("cust_123", "cd_123456789", expand=["customer"])
+        result = contact_details_resource.get(_CUSTOMER_ID, _CONTACT_DETAIL_ID, expand=["customer"])
 
         mock_http_client.get.assert_called_once_with(
-            "customers/cust_123/contact_details/cd_123456789", params={"expand[]": ["customer"]}, return_response=True
+            _CONTACT_DETAIL_PATH, params={"expand[]": ["customer"]}, return_response=True
         )
         assert isinstance(result, ContactDetail)
 
-    def test_delete_contact_detail(self, contact_details_resource, mock_http_client, sample_contact_detail_data):
+    def test_delete_contact_detail(self, contact_details_resource, mock_http_client, ok_response):
         """Test deleting (soft delete) a contact detail."""
         # Mock response with status "deleted"
-        deleted_data = sample_contact_detail_data.copy()
-        deleted_data["status"] = "deleted"
+        deleted_data = dict(_SAMPLE_CONTACT_DETAIL, status="deleted")
 
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_http_client.delete.return_value = (deleted_data, mock_response)
+        mock_http_client.delete.return_value = (deleted_data, ok_response)
 
-        result = contact_details_resource.delete("cust_123", "cd_123456789")
+        result = contact_details_resource.delete(_CUSTOMER_ID, _CONTACT_DETAIL_ID)
 
-        mock_http_client.delete.assert_called_once_with(
-            "customers/cust_123/contact_details/cd_123456789", return_response=True
-        )
+        mock_http_client.delete.assert_called_once_with(_CONTACT_DETAIL_PATH, return_response=True)
         assert isinstance(result, ContactDetail)
         assert result.status == "deleted"
 
     def test_list_contact_details(
-        self, contact_details_resource, mock_http_client, sample_contact_detail_data, sample_paginated_response
+        self,
+        contact_details_resource,
+        mock_http_client,
+        ok_response,
+        sample_contact_detail_data,
+        sample_paginated_response,
     ):
         """Test listing contact details for a customer."""
-        mock_response_data = sample_paginated_response.copy()
-        mock_response_data["data"] = [sample_contact_detail_data]
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_http_client.get.return_value = (mock_response_data, mock_response)
+        mock_response_data = {**sample_paginated_response, "data": [sample_contact_detail_data]}
+        mock_http_client.get.return_value = (mock_response_data, ok_response)
 
-        result = contact_details_resource.list("cust_123", limit=20)
+        result = contact_details_resource.list(_CUSTOMER_ID, limit=20)
 
-        mock_http_client.get.assert_called_once_with(
-            "customers/cust_123/contact_details", params={"limit": 20}, return_response=True
-        )
+        mock_http_client.get.assert_called_once_with(_CONTACT_DETAILS_PATH, params={"limit": 20}, return_response=True)
         assert isinstance(result, PaginatedResponse)
         assert len(result.data) == 1
         assert isinstance(result.data[0], ContactDetail)
 
     def test_list_contact_details_with_pagination(
-        self, contact_details_resource, mock_http_client, sample_contact_detail_data, sample_paginated_response
+        self,
+        contact_details_resource,
+        mock_http_client,
+        ok_response,
+        sample_contact_detail_data,
+        sample_paginated_response,
     ):
         """Test listing contact details with pagination parameters."""
-        mock_response_data = sample_paginated_response.copy()
-        mock_response_data["data"] = [sample_contact_detail_data]
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_http_client.get.return_value = (mock_response_data, mock_response)
+        mock_response_data = {**sample_paginated_response, "data": [sample_contact_detail_data]}
+        mock_http_client.get.return_value = (mock_response_data, ok_response)
 
-        result = contact_details_resource.list("cust_123", limit=10, after="cd_after_123", expand=["customer"])
+        result = contact_details_resource.list(_CUSTOMER_ID, limit=10, after="cd_after_123", expand=["customer"])
 
         mock_http_client.get.assert_called_once_with(
-            "customers/cust_123/contact_details",
+            _CONTACT_DETAILS_PATH,
             params={"limit": 10, "after": "cd_after_123", "expand[]": ["customer"]},
             return_response=True,
         )
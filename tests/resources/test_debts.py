@@ -2,36 +2,21 @@
 Unit tests for debts resource.
 """
 
-from unittest.mock import Mock
-
 import pytest
 
-from ophelos_sdk.http_client import HTTPClient
 from ophelos_sdk.models import Debt, PaginatedResponse, Payment
-from ophelos_sdk.resources import DebtsResource
 
 
 class TestDebtsResource:
     """Test cases for debts resource."""
 
-    @pytest.fixture
-    def mock_http_client(self):
-        """Mock HTTP client for testing."""
-        return Mock(spec=HTTPClient)
-
-    @pytest.fixture
-    def debts_resource(self, mock_http_client):
-        """Create debts resource for testing."""
-        return DebtsResource(mock_http_client)
-
-    def test_list_debts(self, debts_resource, mock_http_client, sample_debt_data, sample_paginated_response):
+    def test_list_debts(
+        self, debts_resource, mock_http_client, ok_response, sample_debt_data, sample_paginated_response
+    ):
         """Test listing debts."""
         # Mock response - keep data as raw dicts, not parsed objects
-        mock_response_data = sample_paginated_response.copy()
-        mock_response_data["data"] = [sample_debt_data]
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_http_client.get.return_value = (mock_response_data, mock_response)
+        mock_response_data = {**sample_paginated_response, "data": [sample_debt_data]}
+        mock_http_client.get.return_value = (mock_response_data, ok_response)
 
         result = debts_resource.list(limit=10, expand=["customer"])
 
@@ -43,13 +28,12 @@ class TestDebtsResource:
         # First item should be parsed as Debt
         assert isinstance(result.data[0], Debt)
 
-    def test_search_debts(self, debts_resource, mock_http_client, sample_debt_data, sample_paginated_response):
+    def test_search_debts(
+        self, debts_resource, mock_http_client, ok_response, sample_debt_data, sample_paginated_response
+    ):
         """Test searching debts."""
-        mock_response_data = sample_paginated_response.copy()
-        mock_response_data["data"] = [sample_debt_data]
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_http_client.get.return_value = (mock_response_data, mock_response)
+        mock_response_data = {**sample_paginated_response, "data": [sample_debt_data]}
+        mock_http_client.get.return_value = (mock_response_data, ok_response)
 
         result = debts_resource.search("status:paying", limit=5)
 
@@ -60,11 +44,9 @@ class TestDebtsResource:
         assert len(result.data) == 1
         assert isinstance(result.data[0], Debt)
 
-    def test_get_debt(self, debts_resource, mock_http_client, sample_debt_data):
+    def test_get_debt(self, debts_resource, mock_http_client, ok_response, sample_debt_data):
         """Test getting a specific debt."""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_http_client.get.return_value = (sample_debt_data, mock_response)
+        mock_http_client.get.return_value = (sample_debt_data, ok_response)
 
         result = debts_resource.get("debt_123", expand=["customer"])
 
@@ -74,112 +56,104 @@ class TestDebtsResource:
         assert isinstance(result, Debt)
         assert result.id == sample_debt_data["id"]
 
-    def test_create_debt(self, debts_resource, mock_http_client, sample_debt_data):
+    def test_create_debt(self, debts_resource, mock_http_client, created_response, sample_debt_data):
         """Test creating a debt."""
         create_data = {
             "customer_id": "cust_123",
             "organisation_id": "org_123",
             "total_amount": 10000,
         }
-        mock_response = Mock()
-        mock_response.status_code = 201
-        mock_http_client.post.return_value = (sample_debt_data, mock_response)
+        mock_http_client.post.return_value = (sample_debt_data, created_response)
 
         result = debts_resource.create(create_data)
 
         mock_http_client.post.assert_called_once_with("debts", data=create_data, return_response=True)
         assert isinstance(result, Debt)
 
-    def test_update_debt(self, debts_resource, mock_http_client, sample_debt_data):
+    def test_update_debt(self, debts_resource, mock_http_client, ok_response, sample_debt_data):
         """Test updating a debt."""
         update_data = {"metadata": {"updated": True}}
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_http_client.put.return_value = (sample_debt_data, mock_response)
+        mock_http_client.put.return_value = (sample_debt_data, ok_response)
 
         result = debts_resource.update("debt_123", update_data)
 
         mock_http_client.put.assert_called_once_with("debts/debt_123", data=update_data, return_response=True)
         assert isinstance(result, Debt)
 
-    def test_delete_debt(self, debts_resource, mock_http_client):
+    def test_delete_debt(self, debts_resource, mock_http_client, ok_response):
         """Test deleting a debt."""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_http_client.delete.return_value = ({"deleted": True}, mock_response)
+        mock_http_client.delete.return_value = ({"deleted": True}, ok_response)
 
         result = debts_resource.delete("debt_123")
 
         mock_http_client.delete.assert_called_once_with("debts/debt_123", return_response=True)
         assert result == {"deleted": True}
 
-    def test_debt_lifecycle_operations(self, debts_resource, mock_http_client, sample_debt_data):
+    @pytest.mark.parametrize(
+        "operation,payload",
+        [
+            ("ready", None),
+            ("pause", {"reason": "customer request"}),
+            ("resume", None),
+            ("withdraw", {"info": "fraud"}),
+            ("dispute", {"reason": "amount disputed", "details": "Customer claims incorrect amount"}),
+        ],
+    )
+    def test_debt_lifecycle_operations(
+        self, debts_resource, mock_http_client, ok_response, sample_debt_data, operation, payload
+    ):
         """Test debt lifecycle operations."""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_http_client.post.return_value = (sample_debt_data, mock_response)
-
-        # Test ready operation
-        result = debts_resource.ready("debt_123")
-        mock_http_client.post.assert_called_with("debts/debt_123/ready", data={}, return_response=True)
-        assert isinstance(result, Debt)
-
-        # Test pause operation
-        pause_data = {"reason": "customer request"}
-        result = debts_resource.pause("debt_123", pause_data)
-        mock_http_client.post.assert_called_with("debts/debt_123/pause", data=pause_data, return_response=True)
-
-        # Test resume operation
-        result = debts_resource.resume("debt_123")
-        mock_http_client.post.assert_called_with("debts/debt_123/resume", data={}, return_response=True)
+        mock_http_client.post.return_value = (sample_debt_data, ok_response)
 
-        # Test withdraw operation
-        withdraw_data = {"info": "fraud"}
-        result = debts_resource.withdraw("debt_123", withdraw_data)
-        mock_http_client.post.assert_called_with("debts/debt_123/withdraw", data=withdraw_data, return_response=True)
+        method = getattr(debts_resource, operation)
+        result = method("debt_123") if payload is None else method("debt_123", payload)
 
-        # Test dispute operation
-        dispute_data = {"reason": "amount disputed", "details": "Customer claims incorrect amount"}
-        result = debts_resource.dispute("debt_123", dispute_data)
-        mock_http_client.post.assert_called_with("debts/debt_123/dispute", data=dispute_data, return_response=True)
+        mock_http_client.post.assert_called_once_with(
+            f"debts/debt_123/{operation}", data=payload or {}, return_response=True
+        )
+        assert isinstance(result, Debt)
 
-    def test_debt_payments_operations(
-        self, debts_resource, mock_http_client, sample_payment_data, sample_paginated_response
+    def test_list_debt_payments(
+        self, debts_resource, mock_http_client, ok_response, sample_payment_data, sample_paginated_response
     ):
-        """Test debt payment operations."""
-        # Test list payments
-        mock_response_data = sample_paginated_response.copy()
-        mock_response_data["data"] = [sample_payment_data]
-        mock_response_obj = Mock()
-        mock_response_obj.status_code = 200
-        mock_http_client.get.return_value = (mock_response_data, mock_response_obj)
+        """Test listing payments for a debt."""
+        mock_response_data = {**sample_paginated_response, "data": [sample_payment_data]}
+        mock_http_client.get.return_value = (mock_response_data, ok_response)
 
         result = debts_resource.list_payments("debt_123", limit=5)
-        mock_http_client.get.assert_called_with("debts/debt_123/payments", params={"limit": 5}, return_response=True)
+
+        mock_http_client.get.assert_called_once_with(
+            "debts/debt_123/payments", params={"limit": 5}, return_response=True
+        )
         assert isinstance(result, PaginatedResponse)
         assert len(result.data) == 1
         assert isinstance(result.data[0], Payment)
 
-        # Test create payment
+    def test_create_debt_payment(self, debts_resource, mock_http_client, created_response, sample_payment_data):
+        """Test creating a payment for a debt."""
         payment_data = {"amount": 5000, "transaction_at": "2024-01-15T10:00:00Z"}
-        mock_http_client.post.return_value = (sample_payment_data, mock_response_obj)
+        mock_http_client.post.return_value = (sample_payment_data, created_response)
 
         result = debts_resource.create_payment("debt_123", payment_data)
-        mock_http_client.post.assert_called_with("debts/debt_123/payments", data=payment_data, return_response=True)
+
+        mock_http_client.post.assert_called_once_with(
+            "debts/debt_123/payments", data=payment_data, return_response=True
+        )
         assert isinstance(result, Payment)
 
-        # Test get payment
-        mock_http_client.get.return_value = (sample_payment_data, mock_response_obj)
+    def test_get_debt_payment(self, debts_resource, mock_http_client, ok_response, sample_payment_data):
+        """Test getting a specific payment for a debt."""
+        mock_http_client.get.return_value = (sample_payment_data, ok_response)
+
         result = debts_resource.get_payment("debt_123", "pay_456")
-        mock_http_client.get.assert_called_with("debts/debt_123/payments/pay_456", return_response=True)
+
+        mock_http_client.get.assert_called_once_with("debts/debt_123/payments/pay_456", return_response=True)
         assert isinstance(result, Payment)
 
-    def test_get_debt_summary(self, debts_resource, mock_http_client):
+    def test_get_debt_summary(self, debts_resource, mock_http_client, ok_response):
         """Test getting debt summary."""
         summary_data = {"total_amount": 10000, "paid_amount": 3000, "remaining": 7000}
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_http_client.get.return_value = (summary_data, mock_response)
+        mock_http_client.get.return_value = (summary_data, ok_response)
 
         result = debts_resource.get_summary("debt_123")
 
@@ -4,26 +4,12 @@ Unit tests for resource error handling.
 
 from unittest.mock import Mock
 
-import pytest
-
-from ophelos_sdk.http_client import HTTPClient
 from ophelos_sdk.models import Debt, PaginatedResponse
-from ophelos_sdk.resources import DebtsResource
 
 
 class TestResourceErrorHandling:
     """Test error handling in resource managers."""
 
-    @pytest.fixture
-    def mock_http_client(self):
-        """Mock HTTP client for testing."""
-        return Mock(spec=HTTPClient)
-
-    @pytest.fixture
-    def debts_resource(self, mock_http_client):
-        """Create debts resource for testing."""
-        return DebtsResource(mock_http_client)
-
     def test_parsing_fallback_on_error(self, debts_resource, mock_http_client):
         """Test that parsing falls back to raw data on error."""
         # Return invalid data that can't be parsed into a Debt model
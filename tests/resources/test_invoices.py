@@ -3,28 +3,17 @@ Unit tests for InvoicesResource.
 """
 
 from datetime import date, datetime, timedelta
-from unittest.mock import MagicMock, Mock
+from unittest.mock import Mock
 
 import pytest
 
 from ophelos_sdk.exceptions import NotFoundError, ValidationError
 from ophelos_sdk.models import Currency, Invoice, LineItem, LineItemKind
-from ophelos_sdk.resources.invoices import InvoicesResource
 
 
 class TestInvoicesResource:
     """Test cases for InvoicesResource."""
 
-    @pytest.fixture
-    def mock_http_client(self):
-        """Create a mock HTTP client."""
-        return MagicMock()
-
-    @pytest.fixture
-    def invoices_resource(self, mock_http_client):
-        """Create an InvoicesResource instance with mock HTTP client."""
-        return InvoicesResource(mock_http_client)
-
     @pytest.fixture
     def sample_invoice_data(self):
         """Sample invoice data for testing."""
@@ -389,16 +378,6 @@ class TestInvoicesResource:
 class TestInvoicesResourceErrorHandling:
     """Test error handling in InvoicesResource."""
 
-    @pytest.fixture
-    def mock_http_client(self):
-        """Create a mock HTTP client."""
-        return MagicMock()
-
-    @pytest.fixture
-    def invoices_resource(self, mock_http_client):
-        """Create an InvoicesResource instance with mock HTTP client."""
-        return InvoicesResource(mock_http_client)
-
     def test_get_invoice_not_found(self, invoices_resource, mock_http_client):
         """Test handling of not found error when getting invoice."""
         debt_id = "debt_123"
@@ -459,16 +438,6 @@ class TestInvoicesResourceErrorHandling:
 class TestInvoicesResourceIntegration:
     """Integration-style tests for InvoicesResource."""
 
-    @pytest.fixture
-    def mock_http_client(self):
-        """Create a mock HTTP client."""
-        return MagicMock()
-
-    @pytest.fixture
-    def invoices_resource(self, mock_http_client):
-        """Create an InvoicesResource instance with mock HTTP client."""
-        return InvoicesResource(mock_http_client)
-
     def test_full_invoice_lifecycle_with_models(self, invoices_resource, mock_http_client):
         """Test full invoice lifecycle using model objects."""
         debt_id = "debt_lifecycle_test"
@@ -2,37 +2,18 @@
 Unit tests for line items resource.
 """
 
-from unittest.mock import Mock
-
-import pytest
-
-from ophelos_sdk.http_client import HTTPClient
 from ophelos_sdk.models import Currency, LineItem, LineItemKind, PaginatedResponse
-from ophelos_sdk.resources import LineItemsResource
 
 
 class TestLineItemsResource:
     """Test cases for line items resource."""
 
-    @pytest.fixture
-    def mock_http_client(self):
-        """Mock HTTP client for testing."""
-        return Mock(spec=HTTPClient)
-
-    @pytest.fixture
-    def line_items_resource(self, mock_http_client):
-        """Create line items resource for testing."""
-        return LineItemsResource(mock_http_client)
-
     def test_list_line_items(
-        self, line_items_resource, mock_http_client, sample_line_item_data, sample_paginated_response
+        self, line_items_resource, mock_http_client, ok_response, sample_line_item_data, sample_paginated_response
     ):
         """Test listing line items for a debt."""
-        mock_response_data = sample_paginated_response.copy()
-        mock_response_data["data"] = [sample_line_item_data]
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_http_client.get.return_value = (mock_response_data, mock_response)
+        mock_response_data = {**sample_paginated_response, "data": [sample_line_item_data]}
+        mock_http_client.get.return_value = (mock_response_data, ok_response)
 
         result = line_items_resource.list("debt_123", limit=10)
 
@@ -45,14 +26,11 @@ class TestLineItemsResource:
         assert result.data[0].id == sample_line_item_data["id"]
 
     def test_list_line_items_with_pagination(
-        self, line_items_resource, mock_http_client, sample_line_item_data, sample_paginated_response
+        self, line_items_resource, mock_http_client, ok_response, sample_line_item_data, sample_paginated_response
     ):
         """Test listing line items with pagination parameters."""
-        mock_response_data = sample_paginated_response.copy()
-        mock_response_data["data"] = [sample_line_item_data]
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_http_client.get.return_value = (mock_response_data, mock_response)
+        mock_response_data = {**sample_paginated_response, "data": [sample_line_item_data]}
+        mock_http_client.get.return_value = (mock_response_data, ok_response)
 
         result = line_items_resource.list(
             "debt_123", limit=5, after="li_after_123", before="li_before_456", expand=["debt"]
@@ -68,14 +46,11 @@ class TestLineItemsResource:
         assert isinstance(result.data[0], LineItem)
 
     def test_list_line_items_with_expand(
-        self, line_items_resource, mock_http_client, sample_line_item_data, sample_paginated_response
+        self, line_items_resource, mock_http_client, ok_response, sample_line_item_data, sample_paginated_response
     ):
         """Test listing line items with expand parameters."""
-        mock_response_data = sample_paginated_response.copy()
-        mock_response_data["data"] = [sample_line_item_data]
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_http_client.get.return_value = (mock_response_data, mock_response)
+        mock_response_data = {**sample_paginated_response, "data": [sample_line_item_data]}
+        mock_http_client.get.return_value = (mock_response_data, ok_response)
 
         result = line_items_resource.list("debt_123", expand=["debt", "invoice"])
 
@@ -85,14 +60,11 @@ class TestLineItemsResource:
         assert isinstance(result, PaginatedResponse)
 
     def test_list_line_items_with_additional_params(
-        self, line_items_resource, mock_http_client, sample_line_item_data, sample_paginated_response
+        self, line_items_resource, mock_http_client, ok_response, sample_line_item_data, sample_paginated_response
     ):
         """Test listing line items with additional query parameters."""
-        mock_response_data = sample_paginated_response.copy()
-        mock_response_data["data"] = [sample_line_item_data]
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_http_client.get.return_value = (mock_response_data, mock_response)
+        mock_response_data = {**sample_paginated_response, "data": [sample_line_item_data]}
+        mock_http_client.get.return_value = (mock_response_data, ok_response)
 
         result = line_items_resource.list("debt_123", limit=20, kind="debt", currency="GBP")
 
@@ -103,7 +75,7 @@ class TestLineItemsResource:
         )
         assert isinstance(result, PaginatedResponse)
 
-    def test_create_line_item(self, line_items_resource, mock_http_client, sample_line_item_data):
+    def test_create_line_item(self, line_items_resource, mock_http_client, created_response, sample_line_item_data):
         """Test creating a line item."""
         create_data = {
             "kind": "debt",
@@ -112,9 +84,7 @@ class TestLineItemsResource:
             "currency": "GBP",
             "metadata": {"category": "principal"},
         }
-        mock_response = Mock()
-        mock_response.status_code = 201
-        mock_http_client.post.return_value = (sample_line_item_data, mock_response)
+        mock_http_client.post.return_value = (sample_line_item_data, created_response)
 
         result = line_items_resource.create("debt_123", create_data)
 
@@ -127,7 +97,7 @@ class TestLineItemsResource:
         assert result.description == sample_line_item_data["description"]
         assert result.amount == sample_line_item_data["amount"]
 
-    def test_create_line_item_with_interest(self, line_items_resource, mock_http_client):
+    def test_create_line_item_with_interest(self, line_items_resource, mock_http_client, created_response):
         """Test creating an interest line item."""
         create_data = {
             "kind": "interest",
@@ -148,9 +118,7 @@ class TestLineItemsResource:
             "metadata": {"interest_rate": "5.5%"},
         }
 
-        mock_response = Mock()
-        mock_response.status_code = 201
-        mock_http_client.post.return_value = (interest_line_item_data, mock_response)
+        mock_http_client.post.return_value = (interest_line_item_data, created_response)
 
         result = line_items_resource.create("debt_123", create_data)
 
@@ -161,7 +129,7 @@ class TestLineItemsResource:
         assert result.kind == "interest"
         assert result.amount == 2500
 
-    def test_create_line_item_with_negative_amount(self, line_items_resource, mock_http_client):
+    def test_create_line_item_with_negative_amount(self, line_items_resource, mock_http_client, created_response):
         """Test creating a credit line item with negative amount."""
         create_data = {
             "kind": "credit",
@@ -182,9 +150,7 @@ class TestLineItemsResource:
             "metadata": {"credit_reason": "overpayment"},
         }
 
-        mock_response = Mock()
-        mock_response.status_code = 201
-        mock_http_client.post.return_value = (credit_line_item_data, mock_response)
+        mock_http_client.post.return_value = (credit_line_item_data, created_response)
 
         result = line_items_resource.create("debt_123", create_data)
 
@@ -195,7 +161,7 @@ class TestLineItemsResource:
         assert result.kind == "credit"
         assert result.amount == -5000
 
-    def test_create_line_item_with_all_kinds(self, line_items_resource, mock_http_client):
+    def test_create_line_item_with_all_kinds(self, line_items_resource, mock_http_client, created_response):
         """Test creating line items with all available kinds."""
         kinds = ["debt", "interest", "fee", "vat", "credit", "discount", "refund", "creditor_refund"]
 
@@ -217,16 +183,14 @@ class TestLineItemsResource:
                 "currency": "GBP",
             }
 
-            mock_response = Mock()
-            mock_response.status_code = 201
-            mock_http_client.post.return_value = (line_item_data, mock_response)
+            mock_http_client.post.return_value = (line_item_data, created_response)
 
             result = line_items_resource.create("debt_123", create_data)
 
             assert isinstance(result, LineItem)
             assert result.kind == kind
 
-    def test_create_line_item_with_minimal_data(self, line_items_resource, mock_http_client):
+    def test_create_line_item_with_minimal_data(self, line_items_resource, mock_http_client, created_response):
         """Test creating a line item with minimal required data."""
         create_data = {
             "kind": "debt",
@@ -241,9 +205,7 @@ class TestLineItemsResource:
             "amount": 50000,
         }
 
-        mock_response = Mock()
-        mock_response.status_code = 201
-        mock_http_client.post.return_value = (minimal_line_item_data, mock_response)
+        mock_http_client.post.return_value = (minimal_line_item_data, created_response)
 
         result = line_items_resource.create("debt_123", create_data)
 
@@ -254,7 +216,9 @@ class TestLineItemsResource:
         assert result.kind == "debt"
         assert result.amount == 50000
 
-    def test_create_line_item_with_model_instance(self, line_items_resource, mock_http_client, sample_line_item_data):
+    def test_create_line_item_with_model_instance(
+        self, line_items_resource, mock_http_client, created_response, sample_line_item_data
+    ):
         """Test creating a line item using a LineItem model instance."""
         # Create a LineItem model instance
         line_item = LineItem(
@@ -277,9 +241,7 @@ class TestLineItemsResource:
             }
         )
 
-        mock_response = Mock()
-        mock_response.status_code = 201
-        mock_http_client.post.return_value = (mock_response_data, mock_response)
+        mock_http_client.post.return_value = (mock_response_data, created_response)
 
         # Pass the LineItem instance directly
         result = line_items_resource.create("debt_123", line_item)
@@ -301,7 +263,9 @@ class TestLineItemsResource:
         assert result.amount == 1500
         assert result.currency == "GBP"
 
-    def test_create_line_item_with_transaction_at(self, line_items_resource, mock_http_client, sample_line_item_data):
+    def test_create_line_item_with_transaction_at(
+        self, line_items_resource, mock_http_client, created_response, sample_line_item_data
+    ):
         """Test creating a line item using a LineItem model instance with transaction_at field."""
         from datetime import datetime
 
@@ -331,9 +295,7 @@ class TestLineItemsResource:
             }
         )
 
-        mock_response = Mock()
-        mock_response.status_code = 201
-        mock_http_client.post.return_value = (mock_response_data, mock_response)
+        mock_http_client.post.return_value = (mock_response_data, created_response)
 
         # Pass the LineItem instance directly
         result = line_items_resource.create("debt_123", line_item)
@@ -359,7 +321,7 @@ class TestLineItemsResource:
         assert result.currency == "GBP"
 
     def test_create_line_item_with_string_transaction_at(
-        self, line_items_resource, mock_http_client, sample_line_item_data
+        self, line_items_resource, mock_http_client, created_response, sample_line_item_data
     ):
         """Test creating a line item using a LineItem model instance with string transaction_at."""
         from datetime import datetime
@@ -391,9 +353,7 @@ class TestLineItemsResource:
             }
         )
 
-        mock_response = Mock()
-        mock_response.status_code = 201
-        mock_http_client.post.return_value = (mock_response_data, mock_response)
+        mock_http_client.post.return_value = (mock_response_data, created_response)
 
         # Pass the LineItem instance directly
         result = line_items_resource.create("debt_123", line_item)
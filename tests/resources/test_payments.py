@@ -3,35 +3,19 @@ Unit tests for payments resource.
 """
 
 from datetime import datetime
-from unittest.mock import Mock
 
-import pytest
-
-from ophelos_sdk.http_client import HTTPClient
 from ophelos_sdk.models import Currency, PaginatedResponse, Payment
-from ophelos_sdk.resources import PaymentsResource
 
 
 class TestPaymentsResource:
     """Test cases for payments resource."""
 
-    @pytest.fixture
-    def mock_http_client(self):
-        """Mock HTTP client for testing."""
-        return Mock(spec=HTTPClient)
-
-    @pytest.fixture
-    def payments_resource(self, mock_http_client):
-        """Create payments resource for testing."""
-        return PaymentsResource(mock_http_client)
-
-    def test_list_payments(self, payments_resource, mock_http_client, sample_payment_data, sample_paginated_response):
+    def test_list_payments(
+        self, payments_resource, mock_http_client, ok_response, sample_payment_data, sample_paginated_response
+    ):
         """Test listing payments."""
-        mock_response_data = sample_paginated_response.copy()
-        mock_response_data["data"] = [sample_payment_data]
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_http_client.get.return_value = (mock_response_data, mock_response)
+        mock_response_data = {**sample_paginated_response, "data": [sample_payment_data]}
+        mock_http_client.get.return_value = (mock_response_data, ok_response)
 
         result = payments_resource.list(limit=20)
 
@@ -40,13 +24,12 @@ class TestPaymentsResource:
         assert len(result.data) == 1
         assert isinstance(result.data[0], Payment)
 
-    def test_search_payments(self, payments_resource, mock_http_client, sample_payment_data, sample_paginated_response):
+    def test_search_payments(
+        self, payments_resource, mock_http_client, ok_response, sample_payment_data, sample_paginated_response
+    ):
         """Test searching payments."""
-        mock_response_data = sample_paginated_response.copy()
-        mock_response_data["data"] = [sample_payment_data]
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_http_client.get.return_value = (mock_response_data, mock_response)
+        mock_response_data = {**sample_paginated_response, "data": [sample_payment_data]}
+        mock_http_client.get.return_value = (mock_response_data, ok_response)
 
         result = payments_resource.search("status:succeeded")
 
@@ -57,11 +40,9 @@ class TestPaymentsResource:
         assert len(result.data) == 1
         assert isinstance(result.data[0], Payment)
 
-    def test_get_payment(self, payments_resource, mock_http_client, sample_payment_data):
+    def test_get_payment(self, payments_resource, mock_http_client, ok_response, sample_payment_data):
         """Test getting a specific payment."""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_http_client.get.return_value = (sample_payment_data, mock_response)
+        mock_http_client.get.return_value = (sample_payment_data, ok_response)
 
         result = payments_resource.get("pay_123")
 
@@ -69,11 +50,9 @@ class TestPaymentsResource:
         assert isinstance(result, Payment)
         assert result.id == sample_payment_data["id"]
 
-    def test_create_payment_with_dict(self, payments_resource, mock_http_client, sample_payment_data):
+    def test_create_payment_with_dict(self, payments_resource, mock_http_client, created_response, sample_payment_data):
         """Test creating a payment with dictionary data."""
-        mock_response = Mock()
-        mock_response.status_code = 201
-        mock_http_client.post.return_value = (sample_payment_data, mock_response)
+        mock_http_client.post.return_value = (sample_payment_data, created_response)
 
         payment_data = {
             "transaction_at": "2023-12-01T10:30:00",
@@ -91,11 +70,11 @@ class TestPaymentsResource:
         assert isinstance(result, Payment)
         assert result.id == sample_payment_data["id"]
 
-    def test_create_payment_with_model(self, payments_resource, mock_http_client, sample_payment_data):
+    def test_create_payment_with_model(
+        self, payments_resource, mock_http_client, created_response, sample_payment_data
+    ):
         """Test creating a payment with Payment model instance."""
-        mock_response = Mock()
-        mock_response.status_code = 201
-        mock_http_client.post.return_value = (sample_payment_data, mock_response)
+        mock_http_client.post.return_value = (sample_payment_data, created_response)
 
         payment_model = Payment(
             transaction_at=datetime(2023, 12, 1, 10, 30, 0),
@@ -120,11 +99,11 @@ class TestPaymentsResource:
         )
         assert isinstance(result, Payment)
 
-    def test_create_payment_with_expand(self, payments_resource, mock_http_client, sample_payment_data):
+    def test_create_payment_with_expand(
+        self, payments_resource, mock_http_client, created_response, sample_payment_data
+    ):
         """Test creating a payment with expand parameter."""
-        mock_response = Mock()
-        mock_response.status_code = 201
-        mock_http_client.post.return_value = (sample_payment_data, mock_response)
+        mock_http_client.post.return_value = (sample_payment_data, created_response)
 
         payment_data = {
             "transaction_at": "2023-12-01T10:30:00",
@@ -140,11 +119,9 @@ class TestPaymentsResource:
         )
         assert isinstance(result, Payment)
 
-    def test_update_payment_with_dict(self, payments_resource, mock_http_client, sample_payment_data):
+    def test_update_payment_with_dict(self, payments_resource, mock_http_client, ok_response, sample_payment_data):
         """Test updating a payment with dictionary data."""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_http_client.put.return_value = (sample_payment_data, mock_response)
+        mock_http_client.put.return_value = (sample_payment_data, ok_response)
 
         update_data = {
             "transaction_ref": "UPDATED-REF-001",
@@ -159,11 +136,9 @@ class TestPaymentsResource:
         assert isinstance(result, Payment)
         assert result.id == sample_payment_data["id"]
 
-    def test_update_payment_with_model(self, payments_resource, mock_http_client, sample_payment_data):
+    def test_update_payment_with_model(self, payments_resource, mock_http_client, ok_response, sample_payment_data):
         """Test updating a payment with Payment model instance."""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_http_client.put.return_value = (sample_payment_data, mock_response)
+        mock_http_client.put.return_value = (sample_payment_data, ok_response)
 
         payment_model = Payment(
             transaction_ref="UPDATED-MODEL-001", amount=30000, metadata={"source": "test_update_model"}
@@ -182,11 +157,9 @@ class TestPaymentsResource:
         )
         assert isinstance(result, Payment)
 
-    def test_update_payment_with_expand(self, payments_resource, mock_http_client, sample_payment_data):
+    def test_update_payment_with_expand(self, payments_resource, mock_http_client, ok_response, sample_payment_data):
         """Test updating a payment with expand parameter."""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_http_client.put.return_value = (sample_payment_data, mock_response)
+        mock_http_client.put.return_value = (sample_payment_data, ok_response)
 
         update_data = {"transaction_ref": "UPDATED-EXPAND-001"}
 
@@ -197,11 +170,11 @@ class TestPaymentsResource:
         )
         assert isinstance(result, Payment)
 
-    def test_update_payment_partial_metadata_only(self, payments_resource, mock_http_client, sample_payment_data):
+    def test_update_payment_partial_metadata_only(
+        self, payments_resource, mock_http_client, ok_response, sample_payment_data
+    ):
         """Test updating a payment with only metadata (partial update)."""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_http_client.put.return_value = (sample_payment_data, mock_response)
+        mock_http_client.put.return_value = (sample_payment_data, ok_response)
 
         # Create Payment model with only metadata
         payment_model = Payment(metadata={"status": "verified", "notes": "Customer confirmed"})
@@ -216,12 +189,10 @@ class TestPaymentsResource:
         assert isinstance(result, Payment)
 
     def test_update_payment_partial_transaction_ref_only(
-        self, payments_resource, mock_http_client, sample_payment_data
+        self, payments_resource, mock_http_client, ok_response, sample_payment_data
     ):
         """Test updating a payment with only transaction_ref (partial update)."""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_http_client.put.return_value = (sample_payment_data, mock_response)
+        mock_http_client.put.return_value = (sample_payment_data, ok_response)
 
         # Create Payment model with only transaction_ref
         payment_model = Payment(transaction_ref="CORRECTED-REF-789")
@@ -235,11 +206,11 @@ class TestPaymentsResource:
         )
         assert isinstance(result, Payment)
 
-    def test_create_payment_model_serialization(self, payments_resource, mock_http_client, sample_payment_data):
+    def test_create_payment_model_serialization(
+        self, payments_resource, mock_http_client, created_response, sample_payment_data
+    ):
         """Test that Payment model instances are properly serialized when creating."""
-        mock_response = Mock()
-        mock_response.status_code = 201
-        mock_http_client.post.return_value = (sample_payment_data, mock_response)
+        mock_http_client.post.return_value = (sample_payment_data, created_response)
 
         # Create Payment model with datetime that needs serialization
         payment_model = Payment(
@@ -264,11 +235,11 @@ class TestPaymentsResource:
             "debts/debt_123/payments", data=expected_data, return_response=True
         )
 
-    def test_update_payment_model_serialization(self, payments_resource, mock_http_client, sample_payment_data):
+    def test_update_payment_model_serialization(
+        self, payments_resource, mock_http_client, ok_response, sample_payment_data
+    ):
         """Test that Payment model instances are properly serialized when updating."""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_http_client.put.return_value = (sample_payment_data, mock_response)
+        mock_http_client.put.return_value = (sample_payment_data, ok_response)
 
         # Create Payment model with datetime that needs serialization
         payment_model = Payment(
@@ -289,11 +260,11 @@ class TestPaymentsResource:
             "debts/debt_123/payments/pay_456", data=expected_data, return_response=True
         )
 
-    def test_create_payment_without_expand(self, payments_resource, mock_http_client, sample_payment_data):
+    def test_create_payment_without_expand(
+        self, payments_resource, mock_http_client, created_response, sample_payment_data
+    ):
         """Test creating a payment without expand parameter (default behavior)."""
-        mock_response = Mock()
-        mock_response.status_code = 201
-        mock_http_client.post.return_value = (sample_payment_data, mock_response)
+        mock_http_client.post.return_value = (sample_payment_data, created_response)
 
         payment_data = {
             "transaction_at": "2023-12-01T10:30:00",
@@ -309,11 +280,9 @@ class TestPaymentsResource:
             "debts/debt_123/payments", data=payment_data, return_response=True
         )
 
-    def test_update_payment_without_expand(self, payments_resource, mock_http_client, sample_payment_data):
+    def test_update_payment_without_expand(self, payments_resource, mock_http_client, ok_response, sample_payment_data):
         """Test updating a payment without expand parameter (default behavior)."""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_http_client.put.return_value = (sample_payment_data, mock_response)
+        mock_http_client.put.return_value = (sample_payment_data, ok_response)
 
         update_data = {"transaction_ref": "NO-EXPAND-UPDATE-001"}
 
@@ -14,6 +14,17 @@ from ophelos_sdk.exceptions import OphelosError
 from ophelos_sdk.models import WebhookEvent
 from ophelos_sdk.webhooks import WebhookHandler, construct_event
 
+_EVENT_TYPES = (
+    "debt.created",
+    "debt.updated",
+    "debt.closed",
+    "debt.withdrawn",
+    "payment.succeeded",
+    "payment.failed",
+    "customer.created",
+    "customer.updated",
+)
+
 
 class TestWebhookHandler:
     """Test cases for webhook handling."""
@@ -165,34 +176,23 @@ class TestWebhookHandler:
         with pytest.raises(OphelosError):
             construct_event(sample_payload, signature_header, webhook_secret, tolerance=50)
 
-    def test_webhook_event_types(self, webhook_handler):
+    @pytest.mark.parametrize("event_type", _EVENT_TYPES)
+    def test_webhook_event_types(self, webhook_handler, event_type):
         """Test parsing different webhook event types."""
-        event_types = [
-            "debt.created",
-            "debt.updated",
-            "debt.closed",
-            "debt.withdrawn",
-            "payment.succeeded",
-            "payment.failed",
-            "customer.created",
-            "customer.updated",
-        ]
-
-        for event_type in event_types:
-            event_data = {
-                "id": f"evt_{event_type.replace('.', '_')}",
-                "object": "event",
-                "type": event_type,
-                "created_at": "2024-01-15T10:00:00Z",
-                "livemode": False,
-                "data": {"id": "test_123", "object": event_type.split(".")[0]},
-            }
-
-            payload = json.dumps(event_data)
-            event = webhook_handler.parse_event(payload)
-
-            assert event.type == event_type
-            assert event.id == event_data["id"]
+        event_data = {
+            "id": f"evt_{event_type.replace('.', '_')}",
+            "object": "event",
+            "type": event_type,
+            "created_at": "2024-01-15T10:00:00Z",
+            "livemode": False,
+            "data": {"id": "test_123", "object": event_type.split(".")[0]},
+        }
+
+        payload = json.dumps(event_data)
+        event = webhook_handler.parse_event(payload)
+
+        assert event.type == event_type
+        assert event.id == event_data["id"]
 
     def test_signature_header_parsing_edge_cases(self, webhook_handler, sample_payload):
         """Test edge cases in signature header parsing."""